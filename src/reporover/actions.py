@@ -1,12 +1,21 @@
 """Determine status of GitHub Actions for GitHub Repositories."""
 
+from typing import Mapping
+
 import requests
 from rich.progress import Progress
 
+from reporover.cache import read_cached_response, write_cached_response
 from reporover.constants import (
     StatusCode,
 )
-from reporover.util import print_json_string
+from reporover.session import github_session
+from reporover.util import (
+    create_headers,
+    get_organization_name,
+    load_response_json,
+    print_json_string,
+)
 
 
 def get_github_actions_status(
@@ -18,27 +27,62 @@ def get_github_actions_status(
 ) -> StatusCode:
     """Report the GitHub Actions status for a repository."""
     # extract the organization name from the URL
-    organization_name = github_organization_url.split("github.com/")[1].split(
-        "/"
-    )[0]
+    organization_name = get_organization_name(github_organization_url)
     # define the full name of the repository
     full_repository_name = f"{repo_prefix}-{username}"
     full_name_for_api = f"{organization_name}/{full_repository_name}"
-    # define the API URL for the GitHub Actions status
-    api_url = f"https://api.github.com/repos/{full_name_for_api}/actions/runs"
+    # define the API URL for the GitHub Actions status; note that only
+    # the latest run is displayed and thus the response only needs one
+    # run instead of a full page of runs that are parsed and discarded;
+    # also note that excluding pull requests only leaves out the list of
+    # pull requests inside of each run to shrink the response and it
+    # still includes the runs that were triggered by a pull request
+    api_url = (
+        f"https://api.github.com/repos/{full_name_for_api}/actions/runs"
+        + "?per_page=1&exclude_pull_requests=true"
+    )
     # headers for the request
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-    # make the GET request to get the GitHub Actions status
-    response = requests.get(api_url, headers=headers)
+    headers: Mapping[str, str] = create_headers(token)
+    # send the ETag of the cached response so that GitHub can answer
+    # with a not modified response that does not count against the
+    # rate limit when the runs did not change since the last request;
+    # note that the shared headers are read-only and thus copied
+    cached_response = read_cached_response(api_url)
+    if cached_response is not None:
+        headers = {**headers, "If-None-Match": cached_response["etag"]}
+    # make the GET request to get the GitHub Actions status; note
+    # that a connection that still fails after the retries of the
+    # session is a failure for this repository and not for all of them
+    try:
+        response = github_session.get(api_url, headers=headers)
+    except requests.RequestException as e:
+        progress.console.print(
+            f" Failed to get GitHub Actions status for {full_repository_name}\n"
+            f"  Diagnostic: {e!s}"
+        )
+        return StatusCode.FAILURE
     # check if the request was successful
-    if response.status_code == StatusCode.WORKING.value:
+    if response.status_code in (
+        StatusCode.WORKING.value,
+        StatusCode.NOT_MODIFIED.value,
+    ):
+        # use the latest run from the cache when it did not change
+        # and otherwise store the latest run with its new ETag
+        if response.status_code == StatusCode.NOT_MODIFIED.value:
+            latest_run = cached_response["body"]  # type: ignore[index]
+        else:
+            runs = load_response_json(response).get("workflow_runs", [])
+            latest_run = None
+            if runs:
+                latest_run = {
+                    "status": runs[0].get("status", "unknown"),
+                    "conclusion": runs[0].get("conclusion", "unknown"),
+                }
+            etag = response.headers.get("ETag")
+            if etag is not None:
+                write_cached_response(api_url, etag, latest_run)
         # there are workflow runs and they should be displayed
-        runs = response.json().get("workflow_runs", [])
-        if runs:
-            latest_run = runs[0]
+        if latest_run:
             status = latest_run.get("status", "unknown")
             conclusion = latest_run.get("conclusion", "unknown")
             progress.console.print(
@@ -0,0 +1,55 @@
+"""Cache the responses of the GitHub API on the local file system."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+def get_cache_directory() -> Path:
+    """Get the directory that stores the cached responses of the GitHub API."""
+    # follow the XDG convention and fall back to the
+    # cache directory in the home directory of the user
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(
+        Path.home() / ".cache"
+    )
+    return Path(cache_home) / "reporover" / "etags"
+
+
+def get_cache_path(key: str) -> Path:
+    """Get the path of the file that stores the cached response for a key."""
+    # hash the key so that any URL is a valid file name
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return get_cache_directory() / f"{digest}.json"
+
+
+def read_cached_response(key: str) -> Optional[Dict[str, Any]]:
+    """Read the cached ETag and body for a key, if there is one."""
+    try:
+        return orjson.loads(get_cache_path(key).read_bytes())
+    # note that a missing or damaged cache file is not an error
+    # because the request can always go to the GitHub API
+    except (OSError, ValueError):
+        return None
+
+
+def write_cached_response(key: str, etag: str, body: Any) -> None:
+    """Write the ETag and body for a key to the cache."""
+    cache_path = get_cache_path(key)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file and then replace the cache file
+        # so that concurrent runs never read a partially written file
+        file_descriptor, temporary_name = tempfile.mkstemp(
+            dir=cache_path.parent, suffix=".tmp"
+        )
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(orjson.dumps({"etag": etag, "body": body}))
+        os.replace(temporary_name, cache_path)
+    # note that the cache only saves requests and
+    # thus a failure to write it is not an error
+    except OSError:
+        return
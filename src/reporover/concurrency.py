@@ -0,0 +1,41 @@
+"""Run the work for each user of a command concurrently."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, TypeVar
+
+from rich.progress import Progress, TaskID
+
+from reporover.constants import Concurrency
+
+T = TypeVar("T")
+
+
+def run_for_usernames(
+    function: Callable[[str], T],
+    usernames: List[str],
+    progress: Progress,
+    task: TaskID,
+    limit: int = Concurrency.DEFAULT.value,
+) -> List[T]:
+    """Run the function for each username with a bounded number of them in flight."""
+    # the function makes blocking requests to the GitHub API that
+    # release the global interpreter lock while they wait and thus
+    # a pool of threads runs the requests for many users at once;
+    # note that the progress bar and its console are thread-safe
+    # note that there is never a need for more threads than
+    # usernames and that the pool needs at least one thread
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(limit, len(usernames)))
+    ) as executor:
+        futures = []
+        for username in usernames:
+            future = executor.submit(function, username)
+            # take the next step in the progress bar from the worker
+            # as each username finishes so that the bar follows the
+            # completion order without the main thread waiting on it
+            future.add_done_callback(lambda _: progress.advance(task))
+            futures.append(future)
+    # note that the results are in the same order
+    # as the usernames even though the function
+    # may finish for the usernames in any order
+    return [future.result() for future in futures]
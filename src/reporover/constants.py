@@ -3,12 +3,24 @@
 from enum import Enum
 
 
+class Concurrency(Enum):
+    """Define the limits on the concurrent requests to the GitHub API."""
+
+    DEFAULT = 16
+
+
 class Data(Enum):
     """Define the attributes inside of the user data."""
 
     USERNAMES = "usernames"
 
 
+class DataFileDetails(Enum):
+    """Define the settings for reading the file of user data."""
+
+    MEMORY_MAP_BYTES = 10 * 1024 * 1024
+
+
 class GitHubAccessLevel(Enum):
     """Define the access levels for GitHub repositories."""
 
@@ -19,6 +31,12 @@ class GitHubAccessLevel(Enum):
     ADMIN = "admin"
 
 
+class GitHubGraphQLDetails(Enum):
+    """Define the details for queries to the GraphQL API of GitHub."""
+
+    BATCH_SIZE = 100
+
+
 class GitHubPullRequestNumber(Enum):
     """Define the pull request number(s) for the GitHub repositories."""
 
@@ -28,10 +46,46 @@ class GitHubPullRequestNumber(Enum):
     DEFAULT = 1
 
 
+class GitHubRateLimitDetails(Enum):
+    """Define the settings for staying within the rate limits of the GitHub API."""
+
+    REQUESTS_PER_SECOND = 10
+    BURST_CAPACITY = 20
+    ATTEMPTS = 3
+    # note that GitHub asks clients to wait at least one minute
+    # before retrying a request that hit a secondary rate limit
+    # without a header that says how long to wait
+    BACKOFF_SECONDS = 60
+    RESERVED_REQUESTS = 50
+
+
+class GitHubRateLimitResource(Enum):
+    """Define the resources of the GitHub API that have separate rate limits."""
+
+    CORE = "core"
+    GRAPHQL = "graphql"
+
+
 class GitHubRepositoryDetails(Enum):
     """Define the details for the GitHub repository."""
 
     BRANCH_DEFAULT = "main"
+    # note that the size is a multiple of three so that the
+    # base64 encoding of each chunk can be joined without padding
+    ENCODE_CHUNK_BYTES = 57 * 1024
+
+
+class GitHubSessionDetails(Enum):
+    """Define the connection pool and retry settings for the GitHub API session."""
+
+    POOL_CONNECTIONS = 1
+    POOL_MAXSIZE = 64
+    RETRY_TOTAL = 5
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_BACKOFF_JITTER = 0.25
+    RETRY_BACKOFF_MAX = 60
+    CONNECT_TIMEOUT = 3.05
+    READ_TIMEOUT = 10
 
 
 class PullRequestMessages(Enum):
@@ -49,12 +103,17 @@ class StatusCode(Enum):
     WORKING = 200
     CREATED = 201
     SUCCESS = 204
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
     NOT_FOUND = 404
     UNPROCESSABLE_ENTITY = 422
+    TOO_MANY_REQUESTS = 429
     INTERNAL_SERVER_ERROR = 500
+    BAD_GATEWAY = 502
+    SERVICE_UNAVAILABLE = 503
+    GATEWAY_TIMEOUT = 504
     FAILURE = 600
 
 
@@ -1,25 +1,38 @@
 """Main module for the reporover command-line interface."""
 
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-import requests
 import typer
 from rich.console import Console
 from rich.progress import BarColumn, Progress, TextColumn
 from typer import Typer
 
 from reporover.actions import get_github_actions_status
+from reporover.concurrency import run_for_usernames
 from reporover.constants import (
+    Concurrency,
     GitHubAccessLevel,
     GitHubPullRequestNumber,
     StatusCode,
 )
 from reporover.pullrequest import leave_pr_comment
 from reporover.repository import clone_repo_gitpython, commit_files_to_repo
+from reporover.session import TokenPool, github_session
 from reporover.status import get_status_from_codes
-from reporover.user import modify_user_access
-from reporover.util import read_usernames_from_json
+from reporover.user import (
+    get_user_access_level,
+    get_user_access_levels,
+    modify_user_access,
+    plan_access_changes,
+)
+from reporover.util import (
+    get_organization_name,
+    parse_tokens,
+    read_usernames_from_json,
+    select_usernames,
+)
 
 # define the Typer app that will be used
 # to run the Typer-based command-line interface
@@ -37,10 +50,184 @@ def display_welcome_message() -> None:
     )
 
 
+def validate_github_org_url(github_org_url: str) -> str:
+    """Validate the URL of the GitHub organization once before any request."""
+    # parse the organization name from the URL before any request
+    # so that a malformed URL stops the command with a clear error;
+    # note that the parsed name is cached for every later request
+    try:
+        get_organization_name(github_org_url)
+    except ValueError as error:
+        raise typer.BadParameter(str(error)) from error
+    return github_org_url
+
+
+def modify_access_and_comment(  # noqa: PLR0913
+    current_username: str,
+    github_org_url: str,
+    repo_prefix: str,
+    access_level: GitHubAccessLevel,
+    pr_message: str,
+    pr_number: int,
+    token_pool: TokenPool,
+    progress: Progress,
+    current_access_levels: Dict[str, str],
+) -> List[StatusCode]:
+    """Modify the access level of one user and comment on their pull request."""
+    # note that passing the progress bar to
+    # each of the following functions allows their
+    # output to be displayed as integrated to the
+    # progress bar that shows task completion
+    # look up the access level of a user whose batch of the
+    # batched lookup failed before deciding to change it
+    current_access_level = current_access_levels.get(current_username)
+    if current_access_level is None:
+        current_access_level = get_user_access_level(
+            github_org_url,
+            repo_prefix,
+            current_username,
+            token_pool.next_token(),
+        )
+    # modify the user's access level
+    modify_user_status_code = modify_user_access(
+        github_org_url,
+        repo_prefix,
+        current_username,
+        access_level,
+        token_pool.next_token(),
+        progress,
+        github_session.put,
+        current_access_level,
+    )
+    # a user whose access level turned out to be the requested
+    # one did not have a change and thus needs no comment about it
+    if current_access_level == access_level.value:
+        return [modify_user_status_code]
+    # leave a comment on the existing PR
+    # to notify the user of the change
+    leave_pr_comment_status_code = leave_pr_comment(
+        github_org_url,
+        repo_prefix,
+        current_username,
+        access_level,
+        pr_message,
+        pr_number,
+        token_pool.next_token(),
+        progress,
+    )
+    # return a list of two status code values;
+    # the first one is the status code from the
+    # modify_user_access function and the
+    # second one is the status code from the
+    # leave_pr_comment function
+    return [modify_user_status_code, leave_pr_comment_status_code]
+
+
+def get_status_for_user(
+    current_username: str,
+    github_org_url: str,
+    repo_prefix: str,
+    token_pool: TokenPool,
+    progress: Progress,
+) -> List[StatusCode]:
+    """Get the GitHub Actions status of the repository for one user."""
+    # get the GitHub Actions status, making sure to return
+    # the status of the attempt to access the GitHub Actions' status
+    return [
+        get_github_actions_status(
+            github_org_url,
+            repo_prefix,
+            current_username,
+            token_pool.next_token(),
+            progress,
+        )
+    ]
+
+
+def leave_comment_for_user(  # noqa: PLR0913
+    current_username: str,
+    github_org_url: str,
+    repo_prefix: str,
+    pr_message: str,
+    pr_number: int,
+    token_pool: TokenPool,
+    progress: Progress,
+) -> List[StatusCode]:
+    """Leave a comment on the pull request of one user."""
+    # leave a comment on the existing PR
+    # to notify the user of the change
+    return [
+        leave_pr_comment(
+            github_org_url,
+            repo_prefix,
+            current_username,
+            None,
+            pr_message,
+            pr_number,
+            token_pool.next_token(),
+            progress,
+        )
+    ]
+
+
+def commit_files_for_user(  # noqa: PLR0913
+    current_username: str,
+    github_org_url: str,
+    repo_prefix: str,
+    token_pool: TokenPool,
+    directory: Path,
+    files: List[Path],
+    commit_message: str,
+    destination_directory: Path,
+    progress: Progress,
+) -> List[StatusCode]:
+    """Commit the files to the repository of one user."""
+    # commit the files to the repository
+    return [
+        commit_files_to_repo(
+            github_org_url,
+            repo_prefix,
+            current_username,
+            token_pool.next_token(),
+            directory,
+            files,
+            commit_message,
+            destination_directory,
+            progress,
+        )
+    ]
+
+
+def clone_repo_for_user(  # noqa: PLR0913
+    current_username: str,
+    github_org_url: str,
+    repo_prefix: str,
+    token_pool: TokenPool,
+    destination_directory: Path,
+    progress: Progress,
+    shallow: bool,
+) -> List[StatusCode]:
+    """Clone the repository of one user to a local directory."""
+    # clone the repository
+    return [
+        clone_repo_gitpython(
+            github_org_url,
+            repo_prefix,
+            current_username,
+            token_pool.next_token(),
+            destination_directory,
+            progress,
+            shallow,
+        )
+    ]
+
+
 @app.command()
 def access(  # noqa: PLR0913
     github_org_url: str = typer.Argument(
-        ..., help="URL of GitHub organization"
+        ...,
+        help="URL of GitHub organization",
+        callback=validate_github_org_url,
     ),
     repo_prefix: str = typer.Argument(
         ..., help="Prefix for GitHub repository"
@@ -48,7 +235,9 @@ def access(  # noqa: PLR0913
     usernames_file: Path = typer.Argument(
         ..., help="Path to JSON file with usernames"
     ),
-    token: str = typer.Argument(..., help="GitHub token for authentication"),
+    token: str = typer.Argument(
+        ..., help="GitHub token(s) for authentication, separated by commas"
+    ),
     username: Optional[List[str]] = typer.Option(
         default=None, help="One or more usernames' accounts to modify"
     ),
@@ -64,6 +253,15 @@ def access(  # noqa: PLR0913
         GitHubAccessLevel.READ.value,
         help="The access level for user",
     ),
+    concurrency: int = typer.Option(
+        Concurrency.DEFAULT.value,
+        min=1,
+        help="Number of users to modify at the same time",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        help="Display the users that need a change without changing them",
+    ),
 ):
     """Modify user access to GitHub repositories."""
     # display the welcome message
@@ -75,18 +273,41 @@ def access(  # noqa: PLR0913
     console.print(
         f":sparkles: Changing all repository access levels to '{access_level.value}' for each valid user"
     )
-    console.print()
     # extract the usernames from the JSON file
     usernames_parsed = read_usernames_from_json(usernames_file)
     # if there exists a list of usernames only use those usernames as long
     # as they are inside of the parsed usernames, the complete list
     # (i.e., the username variable lets you select a subset of those
     # names that are specified in the JSON file of usernames)
-    if username:
-        usernames_parsed = list(set(username) & set(usernames_parsed))
-    # iterate through all of the usernames
-    # display a progress bar based on the
-    # number of usernames in the JSON file
+    usernames_parsed = select_usernames(usernames_parsed, username)
+    # rotate the requests across all of the tokens so
+    # that each token contributes its own rate limit
+    token_pool = TokenPool(parse_tokens(token), github_session.rate_limiter)
+    # look up the current access level of all of the users in
+    # batches so that only the users whose access level is
+    # different from the requested one need a change
+    current_access_levels = get_user_access_levels(
+        github_org_url, repo_prefix, usernames_parsed, token_pool.next_token()
+    )
+    # display the plan of changes before making any of them
+    changed_usernames = plan_access_changes(
+        usernames_parsed, access_level, current_access_levels
+    )
+    console.print(
+        f":sparkles: {len(usernames_parsed) - len(changed_usernames)} users already at"
+        + f" '{access_level.value}'; {len(changed_usernames)} changes required"
+    )
+    # stop after displaying the users that need a change
+    # when this is a dry run that should not change anything
+    if dry_run:
+        for changed_username in changed_usernames:
+            console.print(f"  {changed_username}")
+        return
+    console.print()
+    # iterate through only the usernames that need a change so
+    # that a user who already has the requested access level
+    # receives neither a request nor a comment about a change;
+    # display a progress bar based on the number of these usernames
     with Progress(
         "[progress.description]{task.description}",
         BarColumn(),
@@ -94,55 +315,32 @@ def access(  # noqa: PLR0913
         TextColumn("[progress.completed]{task.completed}/{task.total}"),
     ) as progress:
         task = progress.add_task(
-            "[green]Modifying User's Access", total=len(usernames_parsed)
+            "[green]Modifying User's Access", total=len(changed_usernames)
         )
-        # create a list to keep track of the status codes
-        # returned across each of the following iterations
-        status_codes: List[List[StatusCode]] = []  # type: ignore[arg-type]
-        # modify the access for the current user
-        # and then leave a comment on the existing pull
-        # request (PR); note that this works because GitHub
-        # classroom already creates a PR when the person
+        # modify the access for each user and then leave a comment
+        # on the existing pull request (PR); note that this works
+        # because GitHub classroom already creates a PR when the person
         # accepts an assignment. However, it is also possible
-        # to specify the PR number on the command line.
-        for current_username in usernames_parsed:
-            # note that passing the progress bar to
-            # each of the following functions allows their
-            # output to be displayed as integrated to the
-            # progress bar that shows task completion
-            # modify the user's access level
-            modify_user_status_code = modify_user_access(
-                github_org_url,
-                repo_prefix,
-                current_username,
-                access_level,
-                token,
-                progress,
-                requests.put,
-            )
-            # leave a comment on the existing PR
-            # to notify the user of the change
-            leave_pr_comment_status_code = leave_pr_comment(
-                github_org_url,
-                repo_prefix,
-                current_username,
-                access_level,
-                pr_message,
-                pr_number,
-                token,
-                progress,
-            )
-            # add the status code to the list
-            # as a list of two status code values;
-            # the first one is the status code from the
-            # modify_user_access function and the
-            # second one is the status code from the
-            # leave_pr_comment function
-            status_codes.append(
-                [modify_user_status_code, leave_pr_comment_status_code]
-            )
-            # take the next step in the progress bar
-            progress.advance(task)
+        # to specify the PR number on the command line. Note
+        # that the changes run for a bounded number of users at
+        # once instead of waiting for each user in turn
+        status_codes = run_for_usernames(
+            partial(
+                modify_access_and_comment,
+                github_org_url=github_org_url,
+                repo_prefix=repo_prefix,
+                access_level=access_level,
+                pr_message=pr_message,
+                pr_number=pr_number,
+                token_pool=token_pool,
+                progress=progress,
+                current_access_levels=current_access_levels,
+            ),
+            changed_usernames,
+            progress,
+            task,
+            concurrency,
+        )
     # determine if there was at least one error
     # in the status codes list, which would designate
     # that there was an overall failure in this command
@@ -160,7 +358,9 @@ def access(  # noqa: PLR0913
 @app.command()
 def comment(  # noqa: PLR0913
     github_org_url: str = typer.Argument(
-        ..., help="URL of GitHub organization"
+        ...,
+        help="URL of GitHub organization",
+        callback=validate_github_org_url,
     ),
     repo_prefix: str = typer.Argument(
         ..., help="Prefix for GitHub repository"
@@ -172,7 +372,9 @@ def comment(  # noqa: PLR0913
         ...,
         help="Pull request number in GitHub repository",
     ),
-    token: str = typer.Argument(..., help="GitHub token for authentication"),
+    token: str = typer.Argument(
+        ..., help="GitHub token(s) for authentication, separated by commas"
+    ),
     username: Optional[List[str]] = typer.Option(
         default=None, help="One or more usernames' accounts to modify"
     ),
@@ -180,6 +382,11 @@ def comment(  # noqa: PLR0913
         GitHubPullRequestNumber.DEFAULT.value,
         help="Pull request number in GitHub repository",
     ),
+    concurrency: int = typer.Option(
+        Concurrency.DEFAULT.value,
+        min=1,
+        help="Number of pull requests to comment on at the same time",
+    ),
 ):
     """Comment on a pull request in GitHub repositories."""
     # display the welcome message
@@ -194,8 +401,10 @@ def comment(  # noqa: PLR0913
     # as they are inside of the parsed usernames, the complete list
     # (i.e., the username variable lets you select a subset of those
     # names that are specified in the JSON file of usernames)
-    if username:
-        usernames_parsed = list(set(username) & set(usernames_parsed))
+    usernames_parsed = select_usernames(usernames_parsed, username)
+    # rotate the requests across all of the tokens so
+    # that each token contributes its own rate limit
+    token_pool = TokenPool(parse_tokens(token), github_session.rate_limiter)
     # iterate through all of the usernames
     # display a progress bar based on the
     # number of usernames in the JSON file
@@ -208,30 +417,28 @@ def comment(  # noqa: PLR0913
         task = progress.add_task(
             "[green]Commenting of Pull Requests", total=len(usernames_parsed)
         )
-        # create a list to keep track of the status codes
-        status_codes = []
         # leave a comment on the existing pull
         # request (PR); note that this works because GitHub
         # classroom already creates a PR when the person
         # accepts an assignment. However, it is also possible
-        # to specify the PR number on the command line.
-        for current_username in usernames_parsed:
-            # leave a comment on the existing PR
-            # to notify the user of the change
-            leave_pr_comment_status_code = leave_pr_comment(
-                github_org_url,
-                repo_prefix,
-                current_username,
-                None,
-                pr_message,
-                pr_number,
-                token,
-                progress,
-            )
-            # take the next step in the progress bar
-            progress.advance(task)
-            # store the status code for this iteration
-            status_codes.append([leave_pr_comment_status_code])
+        # to specify the PR number on the command line. Note
+        # that the comments are left for a bounded number of
+        # users at once instead of waiting for each user in turn
+        status_codes = run_for_usernames(
+            partial(
+                leave_comment_for_user,
+                github_org_url=github_org_url,
+                repo_prefix=repo_prefix,
+                pr_message=pr_message,
+                pr_number=pr_number,
+                token_pool=token_pool,
+                progress=progress,
+            ),
+            usernames_parsed,
+            progress,
+            task,
+            concurrency,
+        )
     # determine if there was at least one error
     # in the status codes list, which would designate
     # that there was an overall failure in this command
@@ -247,9 +454,11 @@ def comment(  # noqa: PLR0913
 
 
 @app.command()
-def status(
+def status(  # noqa: PLR0913
     github_org_url: str = typer.Argument(
-        ..., help="URL of GitHub organization"
+        ...,
+        help="URL of GitHub organization",
+        callback=validate_github_org_url,
     ),
     repo_prefix: str = typer.Argument(
         ..., help="Prefix for GitHub repository"
@@ -257,10 +466,17 @@ def status(
     usernames_file: Path = typer.Argument(
         ..., help="Path to JSON file with usernames"
     ),
-    token: str = typer.Argument(..., help="GitHub token for authentication"),
+    token: str = typer.Argument(
+        ..., help="GitHub token(s) for authentication, separated by commas"
+    ),
     username: Optional[List[str]] = typer.Option(
         default=None, help="One or more usernames' accounts to modify"
     ),
+    concurrency: int = typer.Option(
+        Concurrency.DEFAULT.value,
+        min=1,
+        help="Number of repositories to check at the same time",
+    ),
 ):
     """Get the GitHub Actions status for repositories."""
     # create a default console
@@ -277,8 +493,10 @@ def status(
     # as they are inside of the parsed usernames, the complete list
     # (i.e., the username variable lets you select a subset of those
     # names that are specified in the JSON file of usernames)
-    if username:
-        usernames_parsed = list(set(username) & set(usernames_parsed))
+    usernames_parsed = select_usernames(usernames_parsed, username)
+    # rotate the requests across all of the tokens so
+    # that each token contributes its own rate limit
+    token_pool = TokenPool(parse_tokens(token), github_session.rate_limiter)
     # create a progress bar for the GitHub Actions status retrieval
     with Progress(
         "[progress.description]{task.description}",
@@ -289,25 +507,23 @@ def status(
         task = progress.add_task(
             "[green]Getting GitHub Actions Status", total=len(usernames_parsed)
         )
-        # create a list to keep track of the status codes
-        status_codes: List[List[StatusCode]] = []  # type: ignore[arg-type]
         # for each username, determine the status of their GitHub Actions
         # build for the repository associated with the user in the
-        # specified GitHub organization
-        for current_username in usernames_parsed:
-            # get the GitHub Actions status, making sure to store
-            # the status of the attempt to access the GitHub Actions' status
-            access_github_actions_status = get_github_actions_status(
-                github_org_url,
-                repo_prefix,
-                current_username,
-                token,
-                progress,
-            )
-            # store the status code for this iteration
-            status_codes.append([access_github_actions_status])
-            # take the next step in the progress bar
-            progress.advance(task)
+        # specified GitHub organization; note that the requests run
+        # for a bounded number of users at once
+        status_codes = run_for_usernames(
+            partial(
+                get_status_for_user,
+                github_org_url=github_org_url,
+                repo_prefix=repo_prefix,
+                token_pool=token_pool,
+                progress=progress,
+            ),
+            usernames_parsed,
+            progress,
+            task,
+            concurrency,
+        )
     # determine if there was at least one error
     # in the status codes list, which would designate
     # that there was an overall failure in this command
@@ -325,7 +541,9 @@ def status(
 @app.command()
 def commit(  # noqa: PLR0913
     github_org_url: str = typer.Argument(
-        ..., help="URL of GitHub organization"
+        ...,
+        help="URL of GitHub organization",
+        callback=validate_github_org_url,
     ),
     repo_prefix: str = typer.Argument(
         ..., help="Prefix for GitHub repository"
@@ -333,7 +551,9 @@ def commit(  # noqa: PLR0913
     usernames_file: Path = typer.Argument(
         ..., help="Path to JSON file with usernames"
     ),
-    token: str = typer.Argument(..., help="GitHub token for authentication"),
+    token: str = typer.Argument(
+        ..., help="GitHub token(s) for authentication, separated by commas"
+    ),
     directory: Path = typer.Argument(
         ..., help="Directory containing the file(s) to commit"
     ),
@@ -347,6 +567,11 @@ def commit(  # noqa: PLR0913
     username: Optional[List[str]] = typer.Option(
         default=None, help="One or more usernames' accounts to modify"
     ),
+    concurrency: int = typer.Option(
+        Concurrency.DEFAULT.value,
+        min=1,
+        help="Number of repositories to commit to at the same time",
+    ),
 ):
     """Commit files to GitHub repositories."""
     # display the welcome message
@@ -361,8 +586,10 @@ def commit(  # noqa: PLR0913
     # as they are inside of the parsed usernames, the complete list
     # (i.e., the username variable lets you select a subset of those
     # names that are specified in the JSON file of usernames)
-    if username:
-        usernames_parsed = list(set(username) & set(usernames_parsed))
+    usernames_parsed = select_usernames(usernames_parsed, username)
+    # rotate the requests across all of the tokens so
+    # that each token contributes its own rate limit
+    token_pool = TokenPool(parse_tokens(token), github_session.rate_limiter)
     # create a progress bar
     with Progress(
         "[progress.description]{task.description}",
@@ -373,25 +600,26 @@ def commit(  # noqa: PLR0913
         task = progress.add_task(
             "[green]Committing Files", total=len(usernames_parsed)
         )
-        # create a list to keep track of the status codes
-        status_codes: List[List[StatusCode]] = []  # type: ignore[arg-type]
-        for current_username in usernames_parsed:
-            # commit the files to the repository
-            commit_status_code = commit_files_to_repo(
-                github_org_url,
-                repo_prefix,
-                current_username,
-                token,
-                directory,
-                files,
-                commit_message,
-                destination_directory,
-                progress,
-            )
-            # store the status code for this iteration
-            status_codes.append([commit_status_code])
-            # take the next step in the progress bar
-            progress.advance(task)
+        # commit the files to the repository of each user with
+        # a bounded number of the repositories at once; note that
+        # the files of one repository are committed in order
+        status_codes = run_for_usernames(
+            partial(
+                commit_files_for_user,
+                github_org_url=github_org_url,
+                repo_prefix=repo_prefix,
+                token_pool=token_pool,
+                directory=directory,
+                files=files,
+                commit_message=commit_message,
+                destination_directory=destination_directory,
+                progress=progress,
+            ),
+            usernames_parsed,
+            progress,
+            task,
+            concurrency,
+        )
     # determine if there was at least one error
     # in the status codes list, which would designate
     # that there was an overall failure in this command
@@ -409,7 +637,9 @@ def commit(  # noqa: PLR0913
 @app.command()
 def clone(  # noqa: PLR0913
     github_org_url: str = typer.Argument(
-        ..., help="URL of GitHub organization"
+        ...,
+        help="URL of GitHub organization",
+        callback=validate_github_org_url,
     ),
     repo_prefix: str = typer.Argument(
         ..., help="Prefix for GitHub repository"
@@ -417,13 +647,23 @@ def clone(  # noqa: PLR0913
     usernames_file: Path = typer.Argument(
         ..., help="Path to JSON file with usernames"
     ),
-    token: str = typer.Argument(..., help="GitHub token for authentication"),
+    token: str = typer.Argument(
+        ..., help="GitHub token(s) for authentication, separated by commas"
+    ),
     destination_directory: Path = typer.Argument(
         ..., help="Local directory to clone repositories into"
     ),
     username: Optional[List[str]] = typer.Option(
         default=None, help="One or more usernames' accounts to clone"
     ),
+    concurrency: int = typer.Option(
+        Concurrency.DEFAULT.value,
+        min=1,
+        help="Number of repositories to clone at the same time",
+    ),
+    shallow: bool = typer.Option(
+        True, help="Clone only the latest commit of each repository"
+    ),
 ):
     """Clone GitHub repositories to a local directory."""
     # display the welcome message
@@ -438,8 +678,10 @@ def clone(  # noqa: PLR0913
     # as they are inside of the parsed usernames, the complete list
     # (i.e., the username variable lets you select a subset of those
     # names that are specified in the JSON file of usernames)
-    if username:
-        usernames_parsed = list(set(username) & set(usernames_parsed))
+    usernames_parsed = select_usernames(usernames_parsed, username)
+    # rotate the requests across all of the tokens so
+    # that each token contributes its own rate limit
+    token_pool = TokenPool(parse_tokens(token), github_session.rate_limiter)
     # create a progress bar
     with Progress(
         "[progress.description]{task.description}",
@@ -450,21 +692,24 @@ def clone(  # noqa: PLR0913
         task = progress.add_task(
             "[green]Cloning Repositories", total=len(usernames_parsed)
         )
-        status_codes: List[List[StatusCode]] = []  # type: ignore[arg-type]
-        for current_username in usernames_parsed:
-            # clone the repository
-            clone_repo_status_code = clone_repo_gitpython(
-                github_org_url,
-                repo_prefix,
-                current_username,
-                token,
-                destination_directory,
-                progress,
-            )
-            # store the status code for this iteration
-            status_codes.append([clone_repo_status_code])
-            # take the next step in the progress bar
-            progress.advance(task)
+        # clone the repository of each user with a bounded number
+        # of clones at once; note that each clone runs git in its
+        # own process and thus the clones overlap their transfers
+        status_codes = run_for_usernames(
+            partial(
+                clone_repo_for_user,
+                github_org_url=github_org_url,
+                repo_prefix=repo_prefix,
+                token_pool=token_pool,
+                destination_directory=destination_directory,
+                progress=progress,
+                shallow=shallow,
+            ),
+            usernames_parsed,
+            progress,
+            task,
+            concurrency,
+        )
     # determine if there was at least one error
     # in the status codes list, which would designate
     # that there was an overall failure in this command
@@ -10,7 +10,12 @@ from reporover.constants import (
     PullRequestMessages,
     StatusCode,
 )
-from reporover.util import print_json_string
+from reporover.session import github_session
+from reporover.util import (
+    create_headers,
+    get_organization_name,
+    print_json_string,
+)
 
 
 def leave_pr_comment(  # noqa: PLR0913
@@ -25,19 +30,14 @@ def leave_pr_comment(  # noqa: PLR0913
 ) -> StatusCode:
     """Leave a comment on the first pull request of the repository."""
     # extract the organization name from the URL
-    organization_name = github_organization_url.split("github.com/")[1].split(
-        "/"
-    )[0]
+    organization_name = get_organization_name(github_organization_url)
     # define the full name of the repository
     full_repository_name = f"{repo_prefix}-{username}"
     full_name_for_api = f"{organization_name}/{full_repository_name}"
     # define the API URL for the pull request comments
     pr_comments_url = f"https://api.github.com/repos/{full_name_for_api}/issues/{pr_number}/comments"
     # headers for the request
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
+    headers = create_headers(token)
     # build up the data for the request,
     # starting with an empty message
     complete_message = ""
@@ -55,7 +55,16 @@ def leave_pr_comment(  # noqa: PLR0913
         complete_message = f"Hello @{username}! " + f"{message}"
     data = {"body": complete_message}
     # make the POST request to leave the comment
-    response = requests.post(pr_comments_url, headers=headers, json=data)
+    try:
+        response = github_session.post(
+            pr_comments_url, headers=headers, json=data
+        )
+    except requests.RequestException as e:
+        progress.console.print(
+            f" Failed to comment on pull request {pr_number} for GitHub repository {full_repository_name}\n"
+            + f"  Diagnostic: {e!s}"
+        )
+        return StatusCode.FAILURE
     # check if the request was successful
     if response.status_code == StatusCode.CREATED.value:
         progress.console.print(
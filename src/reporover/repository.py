@@ -1,16 +1,75 @@
 """Interact with GitHub repositories."""
 
 import base64
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Deque, Dict, List, Mapping
 
 import requests
-from git import Repo
-from git.exc import GitCommandError
 from rich.progress import Progress
 
+from reporover.cache import read_cached_response, write_cached_response
 from reporover.constants import GitHubRepositoryDetails, StatusCode
-from reporover.util import print_json_string
+from reporover.session import github_session
+from reporover.util import (
+    create_headers,
+    get_organization_name,
+    load_response_json,
+    print_json_string,
+)
+
+
+def get_file_shas(
+    api_url: str, destination_directory: Path, headers: Mapping[str, str]
+) -> Dict[str, str]:
+    """Get the SHA of each file in a directory of a GitHub repository."""
+    # list the whole directory with one request instead of
+    # requesting each file that will be committed on its own;
+    # note that the root of the repository has an empty path
+    directory_path = destination_directory.as_posix()
+    directory_url = api_url + ("" if directory_path == "." else directory_path)
+    # send the ETag of the cached listing so that GitHub can answer
+    # with a not modified response that does not count against the
+    # rate limit when the directory did not change since the last run
+    cached_response = read_cached_response(directory_url)
+    if cached_response is not None:
+        headers = {**headers, "If-None-Match": cached_response["etag"]}
+    response = github_session.get(directory_url, headers=headers)
+    if response.status_code == StatusCode.NOT_MODIFIED.value:
+        return cached_response["body"]  # type: ignore[index]
+    # GitHub responds with not found when the directory does not
+    # exist yet and with a single object when the path is a file;
+    # in both cases none of the files exist in the directory
+    if response.status_code != StatusCode.WORKING.value:
+        return {}
+    entries = load_response_json(response)
+    if not isinstance(entries, list):
+        return {}
+    file_shas = {entry["path"]: entry["sha"] for entry in entries}
+    etag = response.headers.get("ETag")
+    if etag is not None:
+        write_cached_response(directory_url, etag, file_shas)
+    return file_shas
+
+
+def encode_file_content(file_path: Path) -> str:
+    """Encode the content of a file to base64 one chunk at a time."""
+    chunk_bytes = GitHubRepositoryDetails.ENCODE_CHUNK_BYTES.value
+    # read the file in chunks whose size is a multiple of three so
+    # that the encoded chunks join without padding and the raw bytes
+    # of the whole file are never in memory; note that the Contents
+    # API needs the whole encoding inside of one JSON body and thus
+    # the encoding itself is still fully in memory for the upload
+    with file_path.open("rb") as file:
+        encoded_chunks = [
+            base64.b64encode(chunk).decode("ascii")
+            for chunk in iter(partial(file.read, chunk_bytes), b"")
+        ]
+    # join the chunks once instead of keeping a second copy
+    # of the encoding that grows with each of the chunks
+    return "".join(encoded_chunks)
 
 
 def commit_files_to_repo(  # noqa: PLR0913
@@ -26,71 +85,98 @@ def commit_files_to_repo(  # noqa: PLR0913
 ) -> StatusCode:
     """Commit files to a GitHub repository."""
     # extract the organization name from the URL
-    organization_name = github_organization_url.split("github.com/")[1].split(
-        "/"
-    )[0]
+    organization_name = get_organization_name(github_organization_url)
     # build the full repository name and the full name for the API
     full_repository_name = f"{repo_prefix}-{username}"
     full_name_for_api = f"{organization_name}/{full_repository_name}"
     api_url = f"https://api.github.com/repos/{full_name_for_api}/contents/"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-    # iteratively attempt to commit each file
-    for file_path in files:
-        # ensure the file path is relative to the directory
-        # and attempt to create the file content if possible
+    headers = create_headers(token)
+    # look up the values of the enums once instead of once for
+    # each file since they are the same for all of the files
+    branch = GitHubRepositoryDetails.BRANCH_DEFAULT.value
+    committed_status_codes = frozenset(
+        [StatusCode.WORKING.value, StatusCode.CREATED.value]
+    )
+    # encode the next file in a background thread while the request
+    # for the current file waits for GitHub; note that the files are
+    # still committed one at a time because each commit moves the
+    # head of the branch and concurrent commits to it would conflict
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # start encoding the first file so that it overlaps the listing
+        encodings: Deque[Future[str]] = deque(
+            executor.submit(encode_file_content, directory / file_path)
+            for file_path in files[:1]
+        )
+        # find the files that already exist in the destination directory
         try:
-            file_content = (directory / file_path).read_bytes()
-        except (FileNotFoundError, PermissionError, OSError) as e:
+            file_shas = get_file_shas(api_url, destination_directory, headers)
+        except requests.RequestException as e:
             progress.console.print(
-                f" Failed to read file {file_path} from directory {directory}\n"
+                f" Failed to list directory '{destination_directory}' in {full_repository_name}\n"
                 f"  Diagnostic: {e!s}"
             )
             return StatusCode.FAILURE
-        # encode the file content to base64 and prepare the destination path
-        encoded_content = base64.b64encode(file_content).decode()
-        destination_path = destination_directory / file_path.name
-        get_response = requests.get(
-            api_url + destination_path.as_posix(), headers=headers
-        )
-        # the commit data will differ based on whether the file already exists
-        # in the repository or not; if it exists, we need to provide the SHA
-        # to update the file, otherwise we can just create it as a new file
-        if get_response.status_code == StatusCode.WORKING.value:
-            sha = get_response.json()["sha"]
-            data = {
-                "message": commit_message,
-                "content": encoded_content,
-                "branch": GitHubRepositoryDetails.BRANCH_DEFAULT.value,
-                "sha": sha,
-            }
-        else:
+        # iteratively attempt to commit each file
+        for index, file_path in enumerate(files):
+            encoding = encodings.popleft()
+            # start encoding the next file so that it overlaps this commit
+            if index + 1 < len(files):
+                encodings.append(
+                    executor.submit(
+                        encode_file_content, directory / files[index + 1]
+                    )
+                )
+            # ensure the file path is relative to the directory
+            # and attempt to encode the file content to base64
+            try:
+                encoded_content = encoding.result()
+            except (FileNotFoundError, PermissionError, OSError) as e:
+                progress.console.print(
+                    f" Failed to read file {file_path} from directory {directory}\n"
+                    f"  Diagnostic: {e!s}"
+                )
+                return StatusCode.FAILURE
+            # prepare the destination path
+            destination_path = (
+                destination_directory / file_path.name
+            ).as_posix()
+            # the commit data will differ based on whether the file
+            # already exists in the repository or not; if it exists,
+            # we need to provide the SHA to update the file, otherwise
+            # we can just create it as a new file
             data = {
                 "message": commit_message,
                 "content": encoded_content,
-                "branch": GitHubRepositoryDetails.BRANCH_DEFAULT.value,
+                "branch": branch,
             }
-        response = requests.put(
-            api_url + destination_path.as_posix(), headers=headers, json=data
-        )
-        # the commit worked if the status code is either 200 (OK)
-        # or 201 (Created); otherwise, it failed
-        if response.status_code in [
-            StatusCode.WORKING.value,
-            StatusCode.CREATED.value,
-        ]:
-            progress.console.print(
-                f"󰄬 Committed {file_path.name} to {full_repository_name} in directory '{destination_directory}'"
-            )
-        else:
-            progress.console.print(
-                f" Failed to commit {file_path.name} to {full_repository_name} in directory '{destination_directory}'\n"
-                f"  Diagnostic: {response.status_code}"
-            )
-            print_json_string(response.text, progress)
-            return StatusCode.FAILURE
+            sha = file_shas.get(destination_path)
+            if sha is not None:
+                data["sha"] = sha
+            try:
+                response = github_session.put(
+                    api_url + destination_path,
+                    headers=headers,
+                    json=data,
+                )
+            except requests.RequestException as e:
+                progress.console.print(
+                    f" Failed to commit {file_path.name} to {full_repository_name} in directory '{destination_directory}'\n"
+                    f"  Diagnostic: {e!s}"
+                )
+                return StatusCode.FAILURE
+            # the commit worked if the status code is either 200 (OK)
+            # or 201 (Created); otherwise, it failed
+            if response.status_code in committed_status_codes:
+                progress.console.print(
+                    f"󰄬 Committed {file_path.name} to {full_repository_name} in directory '{destination_directory}'"
+                )
+            else:
+                progress.console.print(
+                    f" Failed to commit {file_path.name} to {full_repository_name} in directory '{destination_directory}'\n"
+                    f"  Diagnostic: {response.status_code}"
+                )
+                print_json_string(response.text, progress)
+                return StatusCode.FAILURE
     return StatusCode.WORKING
 
 
@@ -101,12 +187,16 @@ def clone_repo_gitpython(  # noqa: PLR0913
     token: str,
     destination_directory: Path,
     progress: Progress,
+    shallow: bool = True,
 ) -> StatusCode:
     """Clone a GitHub repository to a local directory."""
+    # import GitPython only when cloning a repository because
+    # it is slow to import and no other command needs it
+    from git import Repo  # noqa: PLC0415
+    from git.exc import GitCommandError  # noqa: PLC0415
+
     # extract the organization name from the URL
-    organization_name = github_organization_url.split("github.com/")[1].split(
-        "/"
-    )[0]
+    organization_name = get_organization_name(github_organization_url)
     # define the full name of the repository
     full_repository_name = f"{repo_prefix}-{username}"
     # construct the repository URL with authentication token
@@ -124,8 +214,17 @@ def clone_repo_gitpython(  # noqa: PLR0913
         # directory that already exists
         return StatusCode.FAILURE
     try:
-        # clone the repository using GitPython
-        Repo.clone_from(repo_url, local_path)
+        # clone the repository using GitPython; note that only the
+        # latest commit of the default branch is needed to grade a
+        # repository and thus a shallow clone transfers far less data
+        # unless the full history is needed to review the commits
+        Repo.clone_from(
+            repo_url,
+            local_path,
+            multi_options=["--depth=1", "--single-branch", "--no-tags"]
+            if shallow
+            else [],
+        )
         progress.console.print(
             f"󰄬 Cloned {full_repository_name} to {local_path}"
         )
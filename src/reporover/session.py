@@ -0,0 +1,257 @@
+"""Share a pooled HTTP session for requests to the GitHub API."""
+
+import itertools
+import random
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from reporover.constants import (
+    GitHubRateLimitDetails,
+    GitHubRateLimitResource,
+    GitHubSessionDetails,
+    StatusCode,
+)
+
+
+class RateLimiter:
+    """Limit the rate of requests to the GitHub API with a token bucket."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create a full bucket that refills at the rate of tokens per second."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.rate_limits: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self.lock = threading.Lock()
+
+    def acquire(
+        self,
+        authorization: str = "",
+        resource: str = GitHubRateLimitResource.CORE.value,
+    ) -> None:
+        """Wait until there is a token in the bucket and then take it."""
+        with self.lock:
+            now = time.monotonic()
+            # refill the bucket for the time since the last request
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            # take the token right away so that other threads wait
+            # their turn; a negative balance is the time that the
+            # request must wait before the bucket refills
+            self.tokens -= 1
+            delay = max(
+                -self.tokens / self.rate,
+                self.get_reset_time(authorization, resource) - time.time(),
+            )
+        if delay > 0:
+            time.sleep(delay)
+
+    def get_reset_time(
+        self,
+        authorization: str,
+        resource: str = GitHubRateLimitResource.CORE.value,
+    ) -> float:
+        """Get the time when the exhausted rate limit of an authorization resets."""
+        remaining, reset = self.rate_limits.get(
+            (authorization, resource), (1, 0.0)
+        )
+        return reset if remaining == 0 else 0.0
+
+    def has_remaining(
+        self,
+        authorization: str,
+        reserve: int,
+        resource: str = GitHubRateLimitResource.CORE.value,
+    ) -> bool:
+        """Determine if an authorization has more than a reserve of requests left."""
+        remaining, reset = self.rate_limits.get(
+            (authorization, resource), (reserve, 0.0)
+        )
+        return remaining >= reserve or reset <= time.time()
+
+    def update_from_headers(
+        self, headers: Mapping[str, str], authorization: str = ""
+    ) -> None:
+        """Shrink the bucket to the rate limit that GitHub reports as remaining."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        # note that GitHub has a separate rate limit for each resource
+        # like the REST API and the GraphQL API and thus an exhausted
+        # GraphQL limit must not stop the requests to the REST API
+        resource = headers.get(
+            "X-RateLimit-Resource", GitHubRateLimitResource.CORE.value
+        )
+        with self.lock:
+            # note that the bucket paces the requests to the REST API
+            # that most of the commands make and thus only its limit
+            # shrinks the bucket for all of the requests
+            if resource == GitHubRateLimitResource.CORE.value:
+                self.tokens = min(self.tokens, int(remaining))
+            # note that when the rate limit of an authorization is
+            # exhausted no request with it can work until GitHub resets it
+            self.rate_limits[(authorization, resource)] = (
+                int(remaining),
+                float(reset),
+            )
+
+
+class TokenPool:
+    """Rotate requests across GitHub tokens to use the rate limit of each one."""
+
+    def __init__(self, tokens: List[str], rate_limiter: RateLimiter) -> None:
+        """Create a pool that cycles through the tokens in order."""
+        self.tokens = tokens
+        self.rate_limiter = rate_limiter
+        self.cycle = itertools.cycle(tokens)
+        self.lock = threading.Lock()
+
+    def next_token(self) -> str:
+        """Choose the next token whose rate limit is not nearly exhausted."""
+        reserve = GitHubRateLimitDetails.RESERVED_REQUESTS.value
+        with self.lock:
+            for _ in range(len(self.tokens)):
+                token = next(self.cycle)
+                if self.rate_limiter.has_remaining(f"token {token}", reserve):
+                    return token
+        # every token is nearly exhausted and thus the best
+        # token is the one whose rate limit resets first
+        return min(
+            self.tokens,
+            key=lambda token: self.rate_limiter.get_reset_time(
+                f"token {token}"
+            ),
+        )
+
+
+def get_rate_limit_resource(url: str) -> str:
+    """Determine which rate limit of the GitHub API applies to a request URL."""
+    if urlsplit(url).path.rstrip("/") == "/graphql":
+        return GitHubRateLimitResource.GRAPHQL.value
+    return GitHubRateLimitResource.CORE.value
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """Determine if GitHub rejected the request because of a rate limit."""
+    if response.status_code == StatusCode.TOO_MANY_REQUESTS.value:
+        return True
+    # GitHub uses the forbidden status code for both a missing
+    # permission and a rate limit; only the headers tell them apart
+    # note that a secondary rate limit for too many concurrent
+    # requests often has neither header and only its message says so
+    return response.status_code == StatusCode.FORBIDDEN.value and (
+        "Retry-After" in response.headers
+        or response.headers.get("X-RateLimit-Remaining") == "0"
+        or "secondary rate limit" in response.text.lower()
+    )
+
+
+def get_retry_delay(response: requests.Response, attempt: int) -> float:
+    """Determine how many seconds to wait before retrying a rate-limited request."""
+    # prefer the delay that GitHub asks for and then the time
+    # until the rate limit resets; otherwise back off exponentially
+    # from at least one minute with jitter that only lengthens the
+    # delay so that concurrent requests spread out their retries
+    if "Retry-After" in response.headers:
+        return float(response.headers["Retry-After"])
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = float(response.headers.get("X-RateLimit-Reset", "0"))
+        return max(0.0, reset - time.time())
+    backoff = GitHubRateLimitDetails.BACKOFF_SECONDS.value * 2**attempt
+    return backoff * random.uniform(1.0, 1.5)
+
+
+class GitHubSession(requests.Session):
+    """Send requests to the GitHub API while respecting its rate limits."""
+
+    def __init__(self, rate_limiter: RateLimiter) -> None:
+        """Create a session that takes a token from the rate limiter per request."""
+        super().__init__()
+        self.rate_limiter = rate_limiter
+
+    def request(  # type: ignore[override]
+        self, method: str, url: str, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request, waiting and retrying when GitHub limits the rate."""
+        attempts = GitHubRateLimitDetails.ATTEMPTS.value
+        # note that GitHub tracks the rate limit for each token
+        # and thus the rate limiter does the same
+        authorization = (kwargs.get("headers") or {}).get("Authorization", "")
+        resource = get_rate_limit_resource(url)
+        # bound the time for connecting to and reading from the GitHub
+        # API so that a stalled connection cannot hang a worker forever
+        kwargs.setdefault(
+            "timeout",
+            (
+                GitHubSessionDetails.CONNECT_TIMEOUT.value,
+                GitHubSessionDetails.READ_TIMEOUT.value,
+            ),
+        )
+        for attempt in range(attempts):
+            self.rate_limiter.acquire(authorization, resource)
+            response = super().request(method, url, *args, **kwargs)
+            self.rate_limiter.update_from_headers(
+                response.headers, authorization
+            )
+            # return the response unless it was rate limited and
+            # there is still another attempt available for the request
+            if not is_rate_limited(response) or attempt == attempts - 1:
+                break
+            time.sleep(get_retry_delay(response, attempt))
+        return response
+
+
+def create_session() -> GitHubSession:
+    """Create a session that reuses connections to the GitHub API."""
+    # retry the idempotent requests that fail because of a
+    # transient problem with the servers of the GitHub API or
+    # a dropped connection; a POST is never retried because it
+    # would leave a second comment on a pull request if the
+    # first one worked; note that the jitter keeps the
+    # concurrent requests that failed together from all
+    # retrying at the same moment once the backoff ends
+    retry = Retry(
+        total=GitHubSessionDetails.RETRY_TOTAL.value,
+        backoff_factor=GitHubSessionDetails.RETRY_BACKOFF_FACTOR.value,
+        backoff_jitter=GitHubSessionDetails.RETRY_BACKOFF_JITTER.value,
+        backoff_max=GitHubSessionDetails.RETRY_BACKOFF_MAX.value,
+        status_forcelist=[
+            StatusCode.INTERNAL_SERVER_ERROR.value,
+            StatusCode.BAD_GATEWAY.value,
+            StatusCode.SERVICE_UNAVAILABLE.value,
+            StatusCode.GATEWAY_TIMEOUT.value,
+        ],
+        allowed_methods=["GET", "PUT"],
+    )
+    # keep the connections to the GitHub API alive in a pool
+    # so that all requests after the first one can skip
+    # the TCP and TLS handshakes with the same host
+    adapter = HTTPAdapter(
+        pool_connections=GitHubSessionDetails.POOL_CONNECTIONS.value,
+        pool_maxsize=GitHubSessionDetails.POOL_MAXSIZE.value,
+        max_retries=retry,
+    )
+    # share one rate limiter across all of the requests
+    # so that concurrent requests stay within the limits
+    rate_limiter = RateLimiter(
+        GitHubRateLimitDetails.REQUESTS_PER_SECOND.value,
+        GitHubRateLimitDetails.BURST_CAPACITY.value,
+    )
+    session = GitHubSession(rate_limiter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/vnd.github.v3+json"})
+    return session
+
+
+# create the session that all modules share when
+# they make requests to the GitHub API
+github_session = create_session()
@@ -1,15 +1,35 @@
 """User management module for RepoRover."""
 
-from typing import Callable
+import json
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional
 
+import orjson
 import requests
 from rich.progress import Progress
 
 from reporover.constants import (
     GitHubAccessLevel,
+    GitHubGraphQLDetails,
     StatusCode,
 )
-from reporover.util import print_json_string
+from reporover.session import github_session
+from reporover.util import (
+    create_headers,
+    get_organization_name,
+    load_response_json,
+    print_json_string,
+)
+
+# serialize the body of the request for each access level once
+# since every request for the same access level has the same body;
+# note that the mapping is read-only because all requests share it
+permission_bodies = MappingProxyType(
+    {
+        access_level: orjson.dumps({"permission": access_level.value})
+        for access_level in GitHubAccessLevel
+    }
+)
 
 
 def modify_user_access(  # noqa: PLR0913
@@ -19,32 +39,45 @@ def modify_user_access(  # noqa: PLR0913
     access_level: GitHubAccessLevel,
     token: str,
     progress: Progress,
-    put_request_function: Callable = requests.put,
+    put_request_function: Callable = github_session.put,
+    current_access_level: Optional[str] = None,
 ) -> StatusCode:
     """Change user access to the specified level."""
     # define the status codes for the request
     request_status_code = None
-    # extract the repository name from the URL
-    organization_name = github_organization_url.split("github.com/")[1].split(
-        "/"
-    )[0]
+    # extract the organization name from the URL
+    organization_name = get_organization_name(github_organization_url)
     # define the full name of the repository that involves
     # the prefix of the repository a separating dash and
     # then the name of the user; note that this is the standard
     # adopted by GitHub repositories created by GitHub Classroom
     full_repository_name = repo_prefix + "-" + username
     full_name_for_api = organization_name + "/" + full_repository_name
+    # the user already has the requested access level and
+    # thus there is no need to spend a request on changing it
+    if current_access_level == access_level.value:
+        progress.console.print(
+            f"󰄬 Kept {username}'s access at '{access_level.value}' in"
+            + f" {full_repository_name}"
+        )
+        return StatusCode.SUCCESS
     # define the API URL for the request
     api_url = f"https://api.github.com/repos/{full_name_for_api}/collaborators/{username}"
     # headers for the request
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-    # data for the request
-    data = {"permission": access_level.value}
-    # make the PUT request to change the user's permission
-    response = put_request_function(api_url, headers=headers, json=data)
+    headers = create_headers(token, "application/json")
+    # make the PUT request to change the user's permission, sending
+    # the serialized body of the request for the access level
+    try:
+        response = put_request_function(
+            api_url, headers=headers, data=permission_bodies[access_level]
+        )
+    except requests.RequestException as e:
+        progress.console.print(
+            f" Failed to change {username}'s access to '{access_level.value}' in"
+            + f" {full_repository_name}\n"
+            + f"  Diagnostic: {e!s}"
+        )
+        return StatusCode.FAILURE
     # check if the request was successful
     # display positive configuration since change of the access level worked
     if response.status_code == StatusCode.SUCCESS.value:
@@ -73,3 +106,113 @@ def modify_user_access(  # noqa: PLR0913
         request_status_code = StatusCode.FAILURE
     # return the status code of the request
     return request_status_code
+
+
+def create_access_levels_query(
+    organization_name: str, repo_prefix: str, usernames: List[str]
+) -> str:
+    """Create a GraphQL query for the access level of each user in their repository."""
+    # each user has an aliased field in the query so that one
+    # request can ask about all of the repositories at once;
+    # note that json.dumps quotes and escapes the names
+    # in the same way that GraphQL expects for strings and
+    # that the login argument matches exactly one collaborator
+    # while a search query would also match other logins; GitHub
+    # rejects a connection without a pagination argument
+    fields = [
+        f"u{index}: repository(owner: {json.dumps(organization_name)}, "
+        + f"name: {json.dumps(repo_prefix + '-' + username)}) "
+        + f"{{ collaborators(login: {json.dumps(username)}, first: 1) "
+        + "{ edges { permission node { login } } } }"
+        for index, username in enumerate(usernames)
+    ]
+    return "query { " + " ".join(fields) + " }"
+
+
+def get_user_access_levels(
+    github_organization_url: str,
+    repo_prefix: str,
+    usernames: List[str],
+    token: str,
+    post_request_function: Callable = github_session.post,
+) -> Dict[str, str]:
+    """Get the current access level of each user with batched GraphQL queries."""
+    # extract the organization name from the URL
+    organization_name = get_organization_name(github_organization_url)
+    headers = create_headers(token)
+    access_levels: Dict[str, str] = {}
+    batch_size = GitHubGraphQLDetails.BATCH_SIZE.value
+    # ask about a batch of users in each request instead of
+    # asking about each of the users in a separate request
+    for start in range(0, len(usernames), batch_size):
+        batch = usernames[start : start + batch_size]
+        query = create_access_levels_query(
+            organization_name, repo_prefix, batch
+        )
+        # a failed request leaves these users without a known
+        # access level and thus they will all be changed
+        try:
+            response = post_request_function(
+                "https://api.github.com/graphql",
+                headers=headers,
+                json={"query": query},
+            )
+        except requests.RequestException:
+            continue
+        if response.status_code != StatusCode.WORKING.value:
+            continue
+        # note that a repository that does not exist or that
+        # the token cannot access has a null value in the data
+        data = load_response_json(response).get("data") or {}
+        for index, username in enumerate(batch):
+            repository = data.get(f"u{index}") or {}
+            collaborators = repository.get("collaborators")
+            if collaborators is None:
+                continue
+            # a user who is not yet a collaborator has no access,
+            # which is different from an unknown access level
+            access_levels[username] = "none"
+            for edge in collaborators.get("edges", []):
+                if edge["node"]["login"].lower() == username.lower():
+                    access_levels[username] = edge["permission"].lower()
+    return access_levels
+
+
+def plan_access_changes(
+    usernames: List[str],
+    access_level: GitHubAccessLevel,
+    current_access_levels: Dict[str, str],
+) -> List[str]:
+    """Determine which users do not yet have the requested access level."""
+    # note that a user with an unknown access level needs a change
+    return [
+        username
+        for username in usernames
+        if current_access_levels.get(username) != access_level.value
+    ]
+
+
+def get_user_access_level(
+    github_organization_url: str,
+    repo_prefix: str,
+    username: str,
+    token: str,
+    get_request_function: Callable = github_session.get,
+) -> Optional[str]:
+    """Get the current access level of one user in their repository."""
+    # extract the organization name from the URL
+    organization_name = get_organization_name(github_organization_url)
+    full_name_for_api = f"{organization_name}/{repo_prefix}-{username}"
+    # define the API URL for the permission of the collaborator
+    api_url = f"https://api.github.com/repos/{full_name_for_api}/collaborators/{username}/permission"
+    # an unknown access level means that the access level will be
+    # changed and thus a failed request is not an error here
+    try:
+        response = get_request_function(api_url, headers=create_headers(token))
+    except requests.RequestException:
+        return None
+    if response.status_code != StatusCode.WORKING.value:
+        return None
+    # note that the role name distinguishes all of the access
+    # levels while the permission merges some of them together
+    return load_response_json(response).get("role_name")
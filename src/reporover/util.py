@@ -1,32 +1,114 @@
 """Utility functions for the reporover command-line interface."""
 
-import json
+import mmap
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional
+from urllib.parse import urlsplit
 
+import orjson
+import requests
 from rich.progress import Progress
 
-from reporover.constants import Data
+from reporover.constants import Data, DataFileDetails
+
+
+@lru_cache(maxsize=None)
+def get_organization_name(github_organization_url: str) -> str:
+    """Extract the name of the organization from its GitHub URL."""
+    # note that the result is cached because every
+    # user of a command has the same organization URL
+    url_parts = urlsplit(github_organization_url)
+    # accept a URL without a scheme like github.com/organization
+    if not url_parts.netloc:
+        url_parts = urlsplit(f"https://{github_organization_url}")
+    # accept the host of GitHub with or without the www prefix
+    hostname = (url_parts.hostname or "").removeprefix("www.")
+    organization_name = url_parts.path.strip("/").split("/", 1)[0]
+    if hostname != "github.com" or not organization_name:
+        raise ValueError(
+            f"{github_organization_url} is not the URL of a GitHub organization"
+        )
+    return organization_name
+
+
+@lru_cache(maxsize=8)
+def create_headers(
+    token: str, content_type: Optional[str] = None
+) -> Mapping[str, str]:
+    """Create the read-only headers for a request to the GitHub API."""
+    # note that the headers are cached for each of the tokens
+    # in the token pool and are read-only because every
+    # request that uses the same token shares them
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    if content_type is not None:
+        headers["Content-Type"] = content_type
+    return MappingProxyType(headers)
+
+
+def load_response_json(response: requests.Response) -> Any:
+    """Decode the JSON body of a response from the GitHub API."""
+    # decode the raw bytes of the body with orjson instead of
+    # letting requests decode them to text for the json module
+    return orjson.loads(response.content)
 
 
 def print_json_string(json_string: str, progress: Progress) -> None:
     """Convert JSON string to dictionary and print each key-value pair."""
     # convert the JSON string to a dictionary
-    dictionary = json.loads(json_string)
+    dictionary = orjson.loads(json_string)
     # display each key-value pair in the dictionary;
     # useful for debugging purposes when there is a
-    # response back from the GitHub API after an error
-    for key, value in dictionary.items():
-        progress.console.print(f"  {key}: {value}")
+    # response back from the GitHub API after an error;
+    # note that all of the pairs are displayed with one
+    # call so that the console renders and writes once
+    lines = [f"  {key}: {value}" for key, value in dictionary.items()]
+    if lines:
+        progress.console.print("\n".join(lines))
 
 
 def read_usernames_from_json(file_path: Path) -> List[str]:
     """Read usernames from a JSON file."""
-    # read the JSON file and load contents
-    with file_path.open("r") as file:
-        data = json.load(file)
+    # read the JSON file and load contents; note that a large
+    # file is mapped into memory so that the decoder reads
+    # from the mapped pages instead of a copy of the file
+    if file_path.stat().st_size > DataFileDetails.MEMORY_MAP_BYTES.value:
+        with (
+            file_path.open("rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            data = orjson.loads(view)
+    else:
+        data = orjson.loads(file_path.read_bytes())
     # return the list of usernames in JSON file
     if "usernames" in data:
         return data.get(Data.USERNAMES.value, [])
     # return an empty list if 'usernames' key is not present
     return []
+
+
+def select_usernames(
+    usernames: List[str], selected_usernames: Optional[List[str]]
+) -> List[str]:
+    """Remove duplicate usernames and keep only the selected ones, if any."""
+    # note that the usernames keep the order of the file so that
+    # every run of a command processes the users in the same order
+    unique_usernames = list(dict.fromkeys(usernames))
+    if not selected_usernames:
+        return unique_usernames
+    selected = set(selected_usernames)
+    return [name for name in unique_usernames if name in selected]
+
+
+def parse_tokens(token: str) -> List[str]:
+    """Split a comma-separated list of GitHub tokens."""
+    # note that each token has its own rate limit and
+    # thus more tokens allow more requests to the GitHub API
+    tokens = [part.strip() for part in token.split(",") if part.strip()]
+    # return the original token if it did not contain any tokens
+    return tokens or [token]
@@ -3,9 +3,12 @@
 import json
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
+import requests
 
 from reporover.actions import get_github_actions_status
+from reporover.cache import read_cached_response, write_cached_response
 from reporover.constants import StatusCode
 
 
@@ -35,8 +38,9 @@ def test_get_github_actions_status_success_with_runs(
     # create mock response with workflow runs
     mock_response = Mock()
     mock_response.status_code = StatusCode.WORKING.value
-    mock_response.json = Mock(
-        return_value={
+    mock_response.headers = {}
+    mock_response.content = orjson.dumps(
+        {
             "workflow_runs": [
                 {
                     "status": "completed",
@@ -50,7 +54,7 @@ def test_get_github_actions_status_success_with_runs(
     # create mock GET function
     mock_get = Mock(return_value=mock_response)
     # call the function with patch
-    with patch("reporover.actions.requests.get", mock_get):
+    with patch("reporover.actions.github_session.get", mock_get):
         get_github_actions_status(
             github_organization_url=sample_request_data[
                 "github_organization_url"
@@ -61,7 +65,7 @@ def test_get_github_actions_status_success_with_runs(
             progress=mock_progress,
         )
     # verify the API call was made correctly
-    expected_url = "https://api.github.com/repos/test-org/assignment-testuser/actions/runs"
+    expected_url = "https://api.github.com/repos/test-org/assignment-testuser/actions/runs?per_page=1&exclude_pull_requests=true"
     expected_headers = {
         "Authorization": "token test_token_123",
         "Accept": "application/vnd.github.v3+json",
@@ -82,11 +86,12 @@ def test_get_github_actions_status_no_runs(mock_progress, sample_request_data):
     # create mock response with no workflow runs
     mock_response = Mock()
     mock_response.status_code = StatusCode.WORKING.value
-    mock_response.json = Mock(return_value={"workflow_runs": []})
+    mock_response.headers = {}
+    mock_response.content = orjson.dumps({"workflow_runs": []})
     # create mock GET function
     mock_get = Mock(return_value=mock_response)
     # call the function with patch
-    with patch("reporover.actions.requests.get", mock_get):
+    with patch("reporover.actions.github_session.get", mock_get):
         get_github_actions_status(
             github_organization_url=sample_request_data[
                 "github_organization_url"
@@ -107,12 +112,13 @@ def test_get_github_actions_status_failure(mock_progress, sample_request_data):
     # create mock response for failure
     mock_response = Mock()
     mock_response.status_code = StatusCode.NOT_FOUND.value
+    mock_response.headers = {}
     mock_response.text = json.dumps({"message": "Not Found"})
     # create mock GET function
     mock_get = Mock(return_value=mock_response)
     # mock the print_json_string function
     with patch("reporover.actions.print_json_string") as mock_print_json:
-        with patch("reporover.actions.requests.get", mock_get):
+        with patch("reporover.actions.github_session.get", mock_get):
             get_github_actions_status(
                 github_organization_url=sample_request_data[
                     "github_organization_url"
@@ -156,11 +162,12 @@ def test_get_github_actions_status_url_parsing(mock_progress):
         # create mock response
         mock_response = Mock()
         mock_response.status_code = StatusCode.WORKING.value
-        mock_response.json = Mock(return_value={"workflow_runs": []})
+        mock_response.headers = {}
+        mock_response.content = orjson.dumps({"workflow_runs": []})
         # create mock GET function
         mock_get = Mock(return_value=mock_response)
         # call the function with patch
-        with patch("reporover.actions.requests.get", mock_get):
+        with patch("reporover.actions.github_session.get", mock_get):
             get_github_actions_status(
                 github_organization_url=case["url"],
                 repo_prefix="hw",
@@ -170,7 +177,7 @@ def test_get_github_actions_status_url_parsing(mock_progress):
             )
         # verify correct organization was extracted
         call_args = mock_get.call_args
-        expected_url = f"https://api.github.com/repos/{case['expected_org']}/hw-student/actions/runs"
+        expected_url = f"https://api.github.com/repos/{case['expected_org']}/hw-student/actions/runs?per_page=1&exclude_pull_requests=true"
         assert call_args[0][0] == expected_url
 
 
@@ -199,11 +206,12 @@ def test_get_github_actions_status_repository_name_construction(
         # create mock response
         mock_response = Mock()
         mock_response.status_code = StatusCode.WORKING.value
-        mock_response.json = Mock(return_value={"workflow_runs": []})
+        mock_response.headers = {}
+        mock_response.content = orjson.dumps({"workflow_runs": []})
         # create mock GET function
         mock_get = Mock(return_value=mock_response)
         # call the function with patch
-        with patch("reporover.actions.requests.get", mock_get):
+        with patch("reporover.actions.github_session.get", mock_get):
             get_github_actions_status(
                 github_organization_url=sample_request_data[
                     "github_organization_url"
@@ -215,7 +223,7 @@ def test_get_github_actions_status_repository_name_construction(
             )
         # verify correct repository name in URL
         call_args = mock_get.call_args
-        expected_url = f"https://api.github.com/repos/test-org/{case['expected']}/actions/runs"
+        expected_url = f"https://api.github.com/repos/test-org/{case['expected']}/actions/runs?per_page=1&exclude_pull_requests=true"
         assert call_args[0][0] == expected_url
 
 
@@ -235,12 +243,13 @@ def test_get_github_actions_status_various_status_codes(
         # create mock response
         mock_response = Mock()
         mock_response.status_code = status_code
+        mock_response.headers = {}
         mock_response.text = json.dumps({"error": f"Status {status_code}"})
         # create mock GET function
         mock_get = Mock(return_value=mock_response)
         # mock the print_json_string function
         with patch("reporover.actions.print_json_string"):
-            with patch("reporover.actions.requests.get", mock_get):
+            with patch("reporover.actions.github_session.get", mock_get):
                 get_github_actions_status(
                     github_organization_url=sample_request_data[
                         "github_organization_url"
@@ -253,3 +262,84 @@ def test_get_github_actions_status_various_status_codes(
         # verify error message contains status code
         error_message = mock_progress.console.print.call_args[0][0]
         assert f"Diagnostic: {status_code}" in error_message
+
+
+def test_get_github_actions_status_stores_etag(
+    mock_progress, sample_request_data
+):
+    """Test that a response with an ETag stores the latest run in the cache."""
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.headers = {"ETag": '"abc123"'}
+    mock_response.content = orjson.dumps(
+        {
+            "workflow_runs": [
+                {"status": "completed", "conclusion": "success", "name": "CI"}
+            ]
+        }
+    )
+    mock_get = Mock(return_value=mock_response)
+    with patch("reporover.actions.github_session.get", mock_get):
+        get_github_actions_status(
+            **sample_request_data, progress=mock_progress
+        )
+    cached_response = read_cached_response(
+        "https://api.github.com/repos/test-org/assignment-testuser/actions/runs?per_page=1&exclude_pull_requests=true"
+    )
+    assert cached_response == {
+        "etag": '"abc123"',
+        "body": {"status": "completed", "conclusion": "success"},
+    }
+
+
+def test_get_github_actions_status_not_modified_uses_cache(
+    mock_progress, sample_request_data
+):
+    """Test that a not modified response displays the cached latest run."""
+    api_url = "https://api.github.com/repos/test-org/assignment-testuser/actions/runs?per_page=1&exclude_pull_requests=true"
+    write_cached_response(
+        api_url,
+        '"abc123"',
+        {"status": "in_progress", "conclusion": None},
+    )
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.NOT_MODIFIED.value
+    mock_response.headers = {}
+    mock_get = Mock(return_value=mock_response)
+    with (
+        patch("reporover.actions.github_session.get", mock_get),
+        patch("reporover.actions.load_response_json") as mock_load,
+    ):
+        result = get_github_actions_status(
+            **sample_request_data, progress=mock_progress
+        )
+    assert result == StatusCode.WORKING
+    # verify that the request sent the cached ETag
+    sent_headers = mock_get.call_args[1]["headers"]
+    assert sent_headers["If-None-Match"] == '"abc123"'
+    mock_load.assert_not_called()
+    message = mock_progress.console.print.call_args[0][0]
+    assert "Status: in_progress" in message
+
+
+def test_get_github_actions_status_connection_error(
+    mock_progress, sample_request_data
+):
+    """Test that a connection error is a failure for the repository."""
+    # create mock GET function that cannot connect
+    mock_get = Mock(side_effect=requests.ConnectionError("connection reset"))
+    with patch("reporover.actions.github_session.get", mock_get):
+        result = get_github_actions_status(
+            github_organization_url=sample_request_data[
+                "github_organization_url"
+            ],
+            repo_prefix=sample_request_data["repo_prefix"],
+            username=sample_request_data["username"],
+            token=sample_request_data["token"],
+            progress=mock_progress,
+        )
+    # verify failure status and the diagnostic message
+    assert result == StatusCode.FAILURE
+    error_message = mock_progress.console.print.call_args[0][0]
+    assert "Failed to get GitHub Actions status" in error_message
+    assert "connection reset" in error_message
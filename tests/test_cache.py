@@ -0,0 +1,55 @@
+"""Test cases for the cache module."""
+
+from reporover.cache import (
+    get_cache_directory,
+    get_cache_path,
+    read_cached_response,
+    write_cached_response,
+)
+
+
+def test_get_cache_directory_uses_xdg_cache_home(cache_directory):
+    """Test that the cache directory is inside of XDG_CACHE_HOME."""
+    assert get_cache_directory() == cache_directory / "reporover" / "etags"
+
+
+def test_get_cache_directory_defaults_to_home(monkeypatch, tmp_path):
+    """Test that the cache directory falls back to the home directory."""
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert get_cache_directory() == tmp_path / ".cache" / "reporover" / "etags"
+
+
+def test_get_cache_path_is_file_name_for_url():
+    """Test that each URL has a distinct JSON file in the cache directory."""
+    first_path = get_cache_path("https://api.github.com/repos/org/first")
+    second_path = get_cache_path("https://api.github.com/repos/org/second")
+    assert first_path != second_path
+    assert first_path.parent == get_cache_directory()
+    assert first_path.suffix == ".json"
+
+
+def test_read_cached_response_missing():
+    """Test that a key without a cached response has no cached response."""
+    assert read_cached_response("https://api.github.com/missing") is None
+
+
+def test_write_then_read_cached_response():
+    """Test that a written response can be read again."""
+    write_cached_response("key", '"etag"', {"status": "completed"})
+    assert read_cached_response("key") == {
+        "etag": '"etag"',
+        "body": {"status": "completed"},
+    }
+    # verify that no temporary files remain in the cache
+    assert [path.suffix for path in get_cache_directory().iterdir()] == [
+        ".json"
+    ]
+
+
+def test_read_cached_response_damaged_file():
+    """Test that a damaged cache file has no cached response."""
+    cache_path = get_cache_path("key")
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("{not json")
+    assert read_cached_response("key") is None
@@ -0,0 +1,137 @@
+"""Test cases for the concurrency module."""
+
+# ruff: noqa: PLR2004
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from reporover.concurrency import run_for_usernames
+
+
+class RunningTracker:
+    """Track how many functions are running at the same time."""
+
+    def __init__(self) -> None:
+        """Start with no running functions."""
+        self.lock = threading.Lock()
+        self.running = 0
+        self.most_running = 0
+
+    def run(self, username: str) -> str:
+        """Record a running function and then return the username."""
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return username
+
+
+class CompletionTracker:
+    """Track which functions finished when the progress bar advances."""
+
+    def __init__(self, delays: dict) -> None:
+        """Start with the delay for each username and nothing finished."""
+        self.delays = delays
+        self.finished: list = []
+        self.finished_at_advance: list = []
+
+    def run(self, username: str) -> str:
+        """Wait for the delay of the username and then record it as finished."""
+        time.sleep(self.delays[username])
+        self.finished.append(username)
+        return username
+
+    def advance(self, task: str) -> None:
+        """Record the usernames that finished before the progress bar advanced."""
+        self.finished_at_advance.append(list(self.finished))
+
+
+def test_run_for_usernames_returns_results_in_order():
+    """Test that the results follow the order of the usernames."""
+    progress = Mock()
+    usernames = ["student1", "student2", "student3"]
+    results = run_for_usernames(str.upper, usernames, progress, "task")
+    assert results == ["STUDENT1", "STUDENT2", "STUDENT3"]
+
+
+def test_run_for_usernames_advances_progress_for_each_username():
+    """Test that the progress bar advances once for each username."""
+    progress = Mock()
+    usernames = ["student1", "student2", "student3"]
+    run_for_usernames(len, usernames, progress, "task")
+    assert progress.advance.call_count == len(usernames)
+    progress.advance.assert_called_with("task")
+
+
+def test_run_for_usernames_empty_usernames():
+    """Test that no work happens when there are no usernames."""
+    progress = Mock()
+    function = Mock()
+    results = run_for_usernames(function, [], progress, "task")
+    assert results == []
+    function.assert_not_called()
+    progress.advance.assert_not_called()
+
+
+def test_run_for_usernames_respects_limit():
+    """Test that no more than the limit of functions run at once."""
+    progress = Mock()
+    tracker = RunningTracker()
+    usernames = [f"student{number}" for number in range(10)]
+    results = run_for_usernames(
+        tracker.run, usernames, progress, "task", limit=2
+    )
+    assert results == usernames
+    assert tracker.most_running <= 2
+
+
+def test_run_for_usernames_advances_progress_in_completion_order():
+    """Test that the progress bar advances as soon as any username finishes."""
+    tracker = CompletionTracker({"slow": 0.1, "fast": 0.0})
+    progress = Mock()
+    progress.advance.side_effect = tracker.advance
+    results = run_for_usernames(
+        tracker.run, ["slow", "fast"], progress, "task"
+    )
+    assert results == ["slow", "fast"]
+    # verify that the first step happened before the slow username finished
+    assert tracker.finished_at_advance == [["fast"], ["fast", "slow"]]
+
+
+def test_run_for_usernames_raises_error_of_function():
+    """Test that an error in the function reaches the caller."""
+    progress = Mock()
+    function = Mock(side_effect=[ValueError("failed"), "student2"])
+    with pytest.raises(ValueError, match="failed"):
+        run_for_usernames(function, ["student1", "student2"], progress, "task")
+    assert function.call_count == 2
+
+
+def test_run_for_usernames_advances_progress_from_workers():
+    """Test that the workers advance the progress bar instead of the caller."""
+    threads = []
+    progress = Mock()
+    progress.advance.side_effect = lambda _: threads.append(
+        threading.current_thread()
+    )
+    run_for_usernames(time.sleep, [0.01, 0.01], progress, "task")  # type: ignore[arg-type]
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_run_for_usernames_sizes_pool_to_usernames():
+    """Test that the pool never has more threads than there are usernames."""
+    progress = Mock()
+    with patch(
+        "reporover.concurrency.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    ) as mock_executor:
+        run_for_usernames(
+            str.upper, ["student1", "student2"], progress, "task"
+        )
+    mock_executor.assert_called_once_with(max_workers=2)
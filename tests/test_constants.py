@@ -5,15 +5,38 @@
 from enum import Enum
 
 from reporover.constants import (
+    Concurrency,
     Data,
+    DataFileDetails,
     GitHubAccessLevel,
+    GitHubGraphQLDetails,
     GitHubPullRequestNumber,
+    GitHubRateLimitDetails,
+    GitHubRateLimitResource,
     GitHubRepositoryDetails,
+    GitHubSessionDetails,
     PullRequestMessages,
     StatusCode,
 )
 
 
+def test_concurrency_is_enum():
+    """Test that Concurrency is an Enum class."""
+    assert issubclass(Concurrency, Enum)
+
+
+def test_concurrency_values():
+    """Test that Concurrency has the correct values."""
+    assert Concurrency.DEFAULT.value == 16
+
+
+def test_concurrency_members():
+    """Test that Concurrency enum has exactly the expected members."""
+    expected_members = {"DEFAULT"}
+    actual_members = {member.name for member in Concurrency}
+    assert actual_members == expected_members
+
+
 def test_data_is_enum():
     """Test that Data is an Enum class."""
     assert issubclass(Data, Enum)
@@ -36,6 +59,23 @@ def test_data_enum_members():
     assert actual_members == expected_members
 
 
+def test_data_file_details_is_enum():
+    """Test that DataFileDetails is an Enum class."""
+    assert issubclass(DataFileDetails, Enum)
+
+
+def test_data_file_details_values():
+    """Test that DataFileDetails has the correct values."""
+    assert DataFileDetails.MEMORY_MAP_BYTES.value == 10 * 1024 * 1024
+
+
+def test_data_file_details_members():
+    """Test that DataFileDetails enum has exactly the expected members."""
+    expected_members = {"MEMORY_MAP_BYTES"}
+    actual_members = {member.name for member in DataFileDetails}
+    assert actual_members == expected_members
+
+
 def test_github_access_level_is_enum():
     """Test that GitHubAccessLevel is an Enum class."""
     assert issubclass(GitHubAccessLevel, Enum)
@@ -57,6 +97,51 @@ def test_github_access_level_members():
     assert actual_members == expected_members
 
 
+def test_github_rate_limit_details_is_enum():
+    """Test that GitHubRateLimitDetails is an Enum class."""
+    assert issubclass(GitHubRateLimitDetails, Enum)
+
+
+def test_github_rate_limit_details_values():
+    """Test that GitHubRateLimitDetails has the correct values."""
+    assert GitHubRateLimitDetails.REQUESTS_PER_SECOND.value == 10
+    assert GitHubRateLimitDetails.BURST_CAPACITY.value == 20
+    assert GitHubRateLimitDetails.ATTEMPTS.value == 3
+    assert GitHubRateLimitDetails.BACKOFF_SECONDS.value == 60
+    assert GitHubRateLimitDetails.RESERVED_REQUESTS.value == 50
+
+
+def test_github_rate_limit_details_members():
+    """Test that GitHubRateLimitDetails enum has exactly the expected members."""
+    expected_members = {
+        "REQUESTS_PER_SECOND",
+        "BURST_CAPACITY",
+        "ATTEMPTS",
+        "BACKOFF_SECONDS",
+        "RESERVED_REQUESTS",
+    }
+    actual_members = {member.name for member in GitHubRateLimitDetails}
+    assert actual_members == expected_members
+
+
+def test_github_rate_limit_resource_is_enum():
+    """Test that GitHubRateLimitResource is an Enum class."""
+    assert issubclass(GitHubRateLimitResource, Enum)
+
+
+def test_github_rate_limit_resource_values():
+    """Test that GitHubRateLimitResource has the correct values."""
+    assert GitHubRateLimitResource.CORE.value == "core"
+    assert GitHubRateLimitResource.GRAPHQL.value == "graphql"
+
+
+def test_github_rate_limit_resource_members():
+    """Test that GitHubRateLimitResource enum has exactly the expected members."""
+    expected_members = {"CORE", "GRAPHQL"}
+    actual_members = {member.name for member in GitHubRateLimitResource}
+    assert actual_members == expected_members
+
+
 def test_github_repositority_details_is_enum():
     """Test that GitHubRepositoryDetails is an Enum class."""
     assert issubclass(GitHubRepositoryDetails, Enum)
@@ -65,15 +150,67 @@ def test_github_repositority_details_is_enum():
 def test_github_repository_details_values():
     """Test that GitHubRepositoryDetails has the correct values."""
     assert GitHubRepositoryDetails.BRANCH_DEFAULT.value == "main"
+    assert GitHubRepositoryDetails.ENCODE_CHUNK_BYTES.value == 57 * 1024
+    assert GitHubRepositoryDetails.ENCODE_CHUNK_BYTES.value % 3 == 0
 
 
 def test_github_repository_details_members():
     """Test that GitHubRepositoryDetails enum has exactly the expected members."""
-    expected_members = {"BRANCH_DEFAULT"}
+    expected_members = {"BRANCH_DEFAULT", "ENCODE_CHUNK_BYTES"}
     actual_members = {member.name for member in GitHubRepositoryDetails}
     assert actual_members == expected_members
 
 
+def test_github_session_details_is_enum():
+    """Test that GitHubSessionDetails is an Enum class."""
+    assert issubclass(GitHubSessionDetails, Enum)
+
+
+def test_github_session_details_values():
+    """Test that GitHubSessionDetails has the correct values."""
+    assert GitHubSessionDetails.POOL_CONNECTIONS.value == 1
+    assert GitHubSessionDetails.POOL_MAXSIZE.value == 64
+    assert GitHubSessionDetails.RETRY_TOTAL.value == 5
+    assert GitHubSessionDetails.RETRY_BACKOFF_FACTOR.value == 0.5
+    assert GitHubSessionDetails.RETRY_BACKOFF_JITTER.value == 0.25
+    assert GitHubSessionDetails.RETRY_BACKOFF_MAX.value == 60
+    assert GitHubSessionDetails.CONNECT_TIMEOUT.value == 3.05
+    assert GitHubSessionDetails.READ_TIMEOUT.value == 10
+
+
+def test_github_session_details_members():
+    """Test that GitHubSessionDetails enum has exactly the expected members."""
+    expected_members = {
+        "POOL_CONNECTIONS",
+        "POOL_MAXSIZE",
+        "RETRY_TOTAL",
+        "RETRY_BACKOFF_FACTOR",
+        "RETRY_BACKOFF_JITTER",
+        "RETRY_BACKOFF_MAX",
+        "CONNECT_TIMEOUT",
+        "READ_TIMEOUT",
+    }
+    actual_members = {member.name for member in GitHubSessionDetails}
+    assert actual_members == expected_members
+
+
+def test_github_graphql_details_is_enum():
+    """Test that GitHubGraphQLDetails is an Enum class."""
+    assert issubclass(GitHubGraphQLDetails, Enum)
+
+
+def test_github_graphql_details_values():
+    """Test that GitHubGraphQLDetails has the correct values."""
+    assert GitHubGraphQLDetails.BATCH_SIZE.value == 100
+
+
+def test_github_graphql_details_members():
+    """Test that GitHubGraphQLDetails enum has exactly the expected members."""
+    expected_members = {"BATCH_SIZE"}
+    actual_members = {member.name for member in GitHubGraphQLDetails}
+    assert actual_members == expected_members
+
+
 def test_github_pull_request_number_is_enum():
     """Test that GitHubPullRequestNumber is an Enum class."""
     assert issubclass(GitHubPullRequestNumber, Enum)
@@ -149,12 +286,17 @@ def test_status_code_values():
     assert StatusCode.WORKING.value == 200
     assert StatusCode.CREATED.value == 201
     assert StatusCode.SUCCESS.value == 204
+    assert StatusCode.NOT_MODIFIED.value == 304
     assert StatusCode.BAD_REQUEST.value == 400
     assert StatusCode.UNAUTHORIZED.value == 401
     assert StatusCode.FORBIDDEN.value == 403
     assert StatusCode.NOT_FOUND.value == 404
     assert StatusCode.UNPROCESSABLE_ENTITY.value == 422
+    assert StatusCode.TOO_MANY_REQUESTS.value == 429
     assert StatusCode.INTERNAL_SERVER_ERROR.value == 500
+    assert StatusCode.BAD_GATEWAY.value == 502
+    assert StatusCode.SERVICE_UNAVAILABLE.value == 503
+    assert StatusCode.GATEWAY_TIMEOUT.value == 504
 
 
 def test_status_code_members():
@@ -164,12 +306,17 @@ def test_status_code_members():
         "CREATED",
         "FAILURE",
         "SUCCESS",
+        "NOT_MODIFIED",
         "BAD_REQUEST",
         "UNAUTHORIZED",
         "FORBIDDEN",
         "NOT_FOUND",
         "UNPROCESSABLE_ENTITY",
+        "TOO_MANY_REQUESTS",
         "INTERNAL_SERVER_ERROR",
+        "BAD_GATEWAY",
+        "SERVICE_UNAVAILABLE",
+        "GATEWAY_TIMEOUT",
     }
     actual_members = {member.name for member in StatusCode}
     assert actual_members == expected_members
@@ -198,9 +345,14 @@ def test_all_enums_accessible():
     assert hasattr(StatusCode, "WORKING")
     assert hasattr(StatusCode, "CREATED")
     assert hasattr(StatusCode, "SUCCESS")
+    assert hasattr(StatusCode, "NOT_MODIFIED")
     assert hasattr(StatusCode, "BAD_REQUEST")
     assert hasattr(StatusCode, "UNAUTHORIZED")
     assert hasattr(StatusCode, "FORBIDDEN")
     assert hasattr(StatusCode, "NOT_FOUND")
     assert hasattr(StatusCode, "UNPROCESSABLE_ENTITY")
+    assert hasattr(StatusCode, "TOO_MANY_REQUESTS")
     assert hasattr(StatusCode, "INTERNAL_SERVER_ERROR")
+    assert hasattr(StatusCode, "BAD_GATEWAY")
+    assert hasattr(StatusCode, "SERVICE_UNAVAILABLE")
+    assert hasattr(StatusCode, "GATEWAY_TIMEOUT")
@@ -2,6 +2,7 @@
 
 # ruff: noqa: PLR2004
 
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -16,9 +17,15 @@ from reporover.constants import (
 )
 from reporover.main import (
     app,
+    clone_repo_for_user,
+    commit_files_for_user,
     display_welcome_message,
+    get_status_for_user,
+    leave_comment_for_user,
+    modify_access_and_comment,
     modify_user_access,
 )
+from reporover.session import RateLimiter, TokenPool
 
 runner = CliRunner()
 
@@ -136,6 +143,60 @@ def test_modify_user_access_failure(progress, capsys):
     assert "documentation_url" in captured.out
 
 
+def test_modify_access_and_comment_returns_both_status_codes(progress):
+    """Test that modify_access_and_comment reports the codes of both steps."""
+    with (
+        patch("reporover.main.modify_user_access") as mock_modify_user,
+        patch("reporover.main.leave_pr_comment") as mock_leave_pr,
+    ):
+        mock_modify_user.return_value = StatusCode.SUCCESS
+        mock_leave_pr.return_value = StatusCode.CREATED
+        status_codes = modify_access_and_comment(
+            "student1",
+            github_org_url="https://github.com/org",
+            repo_prefix="repo",
+            access_level=GitHubAccessLevel.WRITE,
+            pr_message="Hello",
+            pr_number=1,
+            token_pool=TokenPool(["first", "second"], RateLimiter(10, 20)),
+            progress=progress,
+            current_access_levels={"student1": "read"},
+        )
+    assert status_codes == [StatusCode.SUCCESS, StatusCode.CREATED]
+    assert mock_modify_user.call_args[0][2] == "student1"
+    assert mock_modify_user.call_args[0][4] == "first"
+    assert mock_modify_user.call_args[0][7] == "read"
+    assert mock_leave_pr.call_args[0][2] == "student1"
+    assert mock_leave_pr.call_args[0][6] == "second"
+
+
+def test_modify_access_and_comment_looks_up_unknown_access_level(progress):
+    """Test that a user missing from the batched lookup is looked up alone."""
+    with (
+        patch("reporover.main.modify_user_access") as mock_modify_user,
+        patch("reporover.main.leave_pr_comment") as mock_leave_pr,
+        patch(
+            "reporover.main.get_user_access_level", return_value="write"
+        ) as mock_get_level,
+    ):
+        mock_modify_user.return_value = StatusCode.SUCCESS
+        mock_leave_pr.return_value = StatusCode.CREATED
+        modify_access_and_comment(
+            "student1",
+            github_org_url="https://github.com/org",
+            repo_prefix="repo",
+            access_level=GitHubAccessLevel.WRITE,
+            pr_message="Hello",
+            pr_number=1,
+            token_pool=TokenPool(["first"], RateLimiter(10, 20)),
+            progress=progress,
+            current_access_levels={},
+        )
+    mock_get_level.assert_called_once()
+    assert mock_get_level.call_args[0][2] == "student1"
+    assert mock_modify_user.call_args[0][7] == "write"
+
+
 def test_cli_access_command_with_all_parameters_success_read(
     temp_usernames_file,
 ):
@@ -144,6 +205,8 @@ def test_cli_access_command_with_all_parameters_success_read(
     with (
         patch("reporover.main.modify_user_access") as mock_modify_user,
         patch("reporover.main.leave_pr_comment") as mock_leave_pr,
+        patch("reporover.main.get_user_access_levels", return_value={}),
+        patch("reporover.main.get_user_access_level", return_value=None),
     ):
         # configure the mocks to simulate success
         mock_modify_user.return_value = StatusCode.SUCCESS
@@ -173,6 +236,151 @@ def test_cli_access_command_with_all_parameters_success_read(
         mock_leave_pr.assert_called()
 
 
+def test_cli_access_command_with_concurrency(temp_usernames_file):
+    """Test the access command passes the concurrency limit to the runner."""
+    # mock the functions called by the CLI
+    with (
+        patch("reporover.main.get_user_access_levels", return_value={}),
+        patch("reporover.main.run_for_usernames") as mock_run,
+    ):
+        # configure the mock to simulate success for one user
+        mock_run.return_value = [[StatusCode.SUCCESS, StatusCode.CREATED]]
+        # define the command arguments with a smaller concurrency
+        result = runner.invoke(
+            app,
+            [
+                "access",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "github_access_token_fake_1234",
+                "--username",
+                "gkapfham",
+                "--concurrency",
+                "2",
+            ],
+        )
+        # verify the command executed successfully
+        assert result.exit_code == 0
+        # verify the runner received the concurrency limit
+        assert mock_run.call_args[0][4] == 2
+
+
+def test_cli_access_command_changes_only_users_that_differ(
+    temp_usernames_file,
+):
+    """Test the access command leaves users at the requested level alone."""
+    # mock the functions called by the CLI
+    with (
+        patch(
+            "reporover.main.get_user_access_levels",
+            return_value={"gkapfham": "read", "student1": "write"},
+        ),
+        patch("reporover.main.modify_user_access") as mock_modify_user,
+        patch("reporover.main.leave_pr_comment") as mock_leave_pr,
+    ):
+        mock_modify_user.return_value = StatusCode.SUCCESS
+        mock_leave_pr.return_value = StatusCode.CREATED
+        result = runner.invoke(
+            app,
+            [
+                "access",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "github_access_token_fake_1234",
+                "--username",
+                "gkapfham",
+                "--username",
+                "student1",
+                "--access-level",
+                "read",
+            ],
+        )
+        # verify that only the user with a different level was changed
+        assert result.exit_code == 0
+        mock_modify_user.assert_called_once()
+        assert mock_modify_user.call_args[0][2] == "student1"
+        mock_leave_pr.assert_called_once()
+        assert mock_leave_pr.call_args[0][2] == "student1"
+
+
+def test_modify_access_and_comment_skips_comment_without_change(progress):
+    """Test that a user found at the requested level gets no comment."""
+    with (
+        patch("reporover.main.modify_user_access") as mock_modify_user,
+        patch("reporover.main.leave_pr_comment") as mock_leave_pr,
+        patch("reporover.main.get_user_access_level", return_value="write"),
+    ):
+        mock_modify_user.return_value = StatusCode.SUCCESS
+        status_codes = modify_access_and_comment(
+            "student1",
+            github_org_url="https://github.com/org",
+            repo_prefix="repo",
+            access_level=GitHubAccessLevel.WRITE,
+            pr_message="Hello",
+            pr_number=1,
+            token_pool=TokenPool(["first"], RateLimiter(10, 20)),
+            progress=progress,
+            current_access_levels={},
+        )
+    assert status_codes == [StatusCode.SUCCESS]
+    mock_leave_pr.assert_not_called()
+
+
+def test_cli_access_command_dry_run_changes_nothing(temp_usernames_file):
+    """Test the access command with a dry run only displays the plan."""
+    # mock the functions called by the CLI
+    with (
+        patch(
+            "reporover.main.get_user_access_levels",
+            return_value={"gkapfham": "read", "student1": "write"},
+        ),
+        patch("reporover.main.modify_user_access") as mock_modify_user,
+        patch("reporover.main.leave_pr_comment") as mock_leave_pr,
+    ):
+        result = runner.invoke(
+            app,
+            [
+                "access",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "github_access_token_fake_1234",
+                "--username",
+                "gkapfham",
+                "--username",
+                "student1",
+                "--access-level",
+                "read",
+                "--dry-run",
+            ],
+        )
+        # verify the command displayed the plan without any changes
+        assert result.exit_code == 0
+        assert "1 users already at 'read'; 1 changes required" in result.output
+        assert "  student1" in result.output
+        mock_modify_user.assert_not_called()
+        mock_leave_pr.assert_not_called()
+
+
+def test_cli_access_command_rejects_zero_concurrency(temp_usernames_file):
+    """Test the access command requires at least one user at a time."""
+    result = runner.invoke(
+        app,
+        [
+            "access",
+            "https://github.com/Allegheny-Computer-Science-202-S2025/",
+            "computer-science-202-algorithm-analysis-executable-exam-3",
+            str(temp_usernames_file),
+            "github_access_token_fake_1234",
+            "--concurrency",
+            "0",
+        ],
+    )
+    assert result.exit_code != 0
+
+
 def test_cli_access_command_with_all_parameters_success_write(
     temp_usernames_file,
 ):
@@ -181,6 +389,8 @@ def test_cli_access_command_with_all_parameters_success_write(
     with (
         patch("reporover.main.modify_user_access") as mock_modify_user,
         patch("reporover.main.leave_pr_comment") as mock_leave_pr,
+        patch("reporover.main.get_user_access_levels", return_value={}),
+        patch("reporover.main.get_user_access_level", return_value=None),
     ):
         # configure the mocks to simulate success
         mock_modify_user.return_value = StatusCode.SUCCESS
@@ -216,6 +426,8 @@ def test_cli_access_command_with_all_parameters_failure(temp_usernames_file):
     with (
         patch("reporover.main.modify_user_access") as mock_modify_user,
         patch("reporover.main.leave_pr_comment") as mock_leave_pr,
+        patch("reporover.main.get_user_access_levels", return_value={}),
+        patch("reporover.main.get_user_access_level", return_value=None),
     ):
         # configure the mocks to simulate failure
         mock_modify_user.return_value = StatusCode.FAILURE
@@ -246,6 +458,53 @@ def test_cli_access_command_with_all_parameters_failure(temp_usernames_file):
         mock_leave_pr.assert_called()
 
 
+def test_leave_comment_for_user_comments_without_access_level(progress):
+    """Test that leave_comment_for_user only leaves the message."""
+    with patch("reporover.main.leave_pr_comment") as mock_leave_pr:
+        mock_leave_pr.return_value = StatusCode.CREATED
+        status_codes = leave_comment_for_user(
+            "student1",
+            github_org_url="https://github.com/org",
+            repo_prefix="repo",
+            pr_message="Hello",
+            pr_number=2,
+            token_pool=TokenPool(["token"], RateLimiter(10, 20)),
+            progress=progress,
+        )
+    assert status_codes == [StatusCode.CREATED]
+    assert mock_leave_pr.call_args[0][2] == "student1"
+    assert mock_leave_pr.call_args[0][3] is None
+    assert mock_leave_pr.call_args[0][5] == 2
+
+
+def test_cli_comment_command_with_concurrency(temp_usernames_file):
+    """Test the comment command passes the concurrency limit to the runner."""
+    # mock the functions called by the CLI
+    with patch("reporover.main.run_for_usernames") as mock_run:
+        # configure the mock to simulate success for one user
+        mock_run.return_value = [[StatusCode.CREATED]]
+        # define the command arguments with a smaller concurrency
+        result = runner.invoke(
+            app,
+            [
+                "comment",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "Hello",
+                "github_access_token_fake_1234",
+                "--username",
+                "gkapfham",
+                "--concurrency",
+                "4",
+            ],
+        )
+        # verify the command executed successfully
+        assert result.exit_code == 0
+        # verify the runner received the concurrency limit
+        assert mock_run.call_args[0][4] == 4
+
+
 def test_cli_comment_command_with_all_parameters_success(temp_usernames_file):
     """Test the comment command with all parameters provided for success case."""
     # mock the functions called by the CLI
@@ -504,6 +763,109 @@ def test_cli_status_command_mixed_success_failure(temp_usernames_file):
         # verify the mocked function was called multiple times
 
 
+def test_cli_status_command_rejects_malformed_url(temp_usernames_file):
+    """Test the status command stops before any request for a malformed URL."""
+    # mock the functions called by the CLI
+    with patch("reporover.main.get_github_actions_status") as mock_get_status:
+        # define the command arguments with a URL that has no organization
+        result = runner.invoke(
+            app,
+            [
+                "status",
+                "https://gitlab.com/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "github_access_token_fake_1234",
+            ],
+        )
+        # verify that the command reported a usage error
+        assert result.exit_code == 2
+        assert "Invalid value" in result.output
+        # verify that no request was made
+        mock_get_status.assert_not_called()
+
+
+def test_cli_status_command_rotates_tokens(temp_usernames_file):
+    """Test the status command with several tokens rotates them per user."""
+    # mock the functions called by the CLI
+    with (
+        patch("reporover.main.get_github_actions_status") as mock_get_status,
+        patch(
+            "reporover.main.read_usernames_from_json"
+        ) as mock_read_usernames,
+    ):
+        # configure the mocks to simulate success for three users
+        mock_read_usernames.return_value = ["gkapfham", "student1", "student2"]
+        mock_get_status.return_value = StatusCode.SUCCESS
+        # define the command arguments with two comma-separated tokens
+        result = runner.invoke(
+            app,
+            [
+                "status",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "token_one,token_two",
+            ],
+        )
+        # verify the command executed successfully
+        assert result.exit_code == 0
+        # verify that the tokens alternated across the users; note
+        # that the users run concurrently and thus in any order
+        tokens = [call[0][3] for call in mock_get_status.call_args_list]
+        assert sorted(tokens) == ["token_one", "token_one", "token_two"]
+
+
+def test_get_status_for_user_uses_next_token(progress):
+    """Test that get_status_for_user reports the status with the next token."""
+    with patch("reporover.main.get_github_actions_status") as mock_get_status:
+        mock_get_status.return_value = StatusCode.SUCCESS
+        status_codes = get_status_for_user(
+            "student1",
+            github_org_url="https://github.com/org",
+            repo_prefix="repo",
+            token_pool=TokenPool(["first", "second"], RateLimiter(10, 20)),
+            progress=progress,
+        )
+    assert status_codes == [StatusCode.SUCCESS]
+    assert mock_get_status.call_args[0][2] == "student1"
+    assert mock_get_status.call_args[0][3] == "first"
+
+
+def test_cli_status_command_with_concurrency(temp_usernames_file):
+    """Test the status command passes the concurrency limit to the runner."""
+    # mock the functions called by the CLI
+    with (
+        patch("reporover.main.get_github_actions_status") as mock_get_status,
+        patch("reporover.main.run_for_usernames") as mock_run,
+        patch(
+            "reporover.main.read_usernames_from_json"
+        ) as mock_read_usernames,
+    ):
+        # configure the mocks to simulate success for two users
+        mock_read_usernames.return_value = ["gkapfham", "student1"]
+        mock_run.return_value = [[StatusCode.SUCCESS], [StatusCode.SUCCESS]]
+        # define the command arguments with a smaller concurrency
+        result = runner.invoke(
+            app,
+            [
+                "status",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "github_access_token_fake_1234",
+                "--concurrency",
+                "3",
+            ],
+        )
+        # verify the command executed successfully
+        assert result.exit_code == 0
+        # verify the runner received the users and the concurrency limit
+        assert mock_run.call_args[0][1] == ["gkapfham", "student1"]
+        assert mock_run.call_args[0][4] == 3
+        mock_get_status.assert_not_called()
+
+
 def test_cli_commit_command_with_all_parameters_success(temp_usernames_file):
     """Test the commit command with all parameters provided for success case."""
     # mock the functions called by the CLI
@@ -534,6 +896,41 @@ def test_cli_commit_command_with_all_parameters_success(temp_usernames_file):
         mock_commit_files.assert_called()
 
 
+def test_cli_commit_command_rotates_tokens(temp_usernames_file):
+    """Test the commit command with several tokens rotates them per user."""
+    # mock the functions called by the CLI
+    with (
+        patch("reporover.main.commit_files_to_repo") as mock_commit_files,
+        patch(
+            "reporover.main.read_usernames_from_json"
+        ) as mock_read_usernames,
+    ):
+        # configure the mocks to simulate success for three users
+        mock_read_usernames.return_value = ["gkapfham", "student1", "student2"]
+        mock_commit_files.return_value = StatusCode.SUCCESS
+        # define the command arguments with two comma-separated tokens
+        result = runner.invoke(
+            app,
+            [
+                "commit",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "token_one,token_two",
+                "/tmp/source",
+                "test.py",
+                "Initial commit of files",
+                "src",
+            ],
+        )
+        # verify the command executed successfully
+        assert result.exit_code == 0
+        # verify that the tokens alternated across the users; note
+        # that the users run concurrently and thus in any order
+        tokens = [call[0][3] for call in mock_commit_files.call_args_list]
+        assert sorted(tokens) == ["token_one", "token_one", "token_two"]
+
+
 def test_cli_commit_command_with_all_parameters_failure(temp_usernames_file):
     """Test the commit command with all parameters provided for failure case."""
     # mock the functions called by the CLI
@@ -666,6 +1063,57 @@ def test_cli_commit_command_multiple_files(temp_usernames_file):
         mock_commit_files.assert_called()
 
 
+def test_commit_files_for_user_commits_all_files(progress):
+    """Test that commit_files_for_user commits the files for one user."""
+    with patch("reporover.main.commit_files_to_repo") as mock_commit_files:
+        mock_commit_files.return_value = StatusCode.WORKING
+        status_codes = commit_files_for_user(
+            "student1",
+            github_org_url="https://github.com/org",
+            repo_prefix="repo",
+            token_pool=TokenPool(["token"], RateLimiter(10, 20)),
+            directory=Path("/tmp/source"),
+            files=[Path("a.py"), Path("b.py")],
+            commit_message="Add files",
+            destination_directory=Path("src"),
+            progress=progress,
+        )
+    assert status_codes == [StatusCode.WORKING]
+    assert mock_commit_files.call_args[0][2] == "student1"
+    assert mock_commit_files.call_args[0][5] == [Path("a.py"), Path("b.py")]
+
+
+def test_cli_commit_command_with_concurrency(temp_usernames_file):
+    """Test the commit command passes the concurrency limit to the runner."""
+    # mock the functions called by the CLI
+    with patch("reporover.main.run_for_usernames") as mock_run:
+        # configure the mock to simulate success for one user
+        mock_run.return_value = [[StatusCode.WORKING]]
+        # define the command arguments with a smaller concurrency
+        result = runner.invoke(
+            app,
+            [
+                "commit",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "github_access_token_fake_1234",
+                "/tmp/source",
+                "test.py",
+                "Initial commit of files",
+                "src",
+                "--username",
+                "gkapfham",
+                "--concurrency",
+                "5",
+            ],
+        )
+        # verify the command executed successfully
+        assert result.exit_code == 0
+        # verify the runner received the concurrency limit
+        assert mock_run.call_args[0][4] == 5
+
+
 def test_cli_clone_command_with_all_parameters_success(temp_usernames_file):
     """Test the clone command with all parameters provided for success case."""
     # mock the functions called by the CLI
@@ -842,3 +1290,77 @@ def test_cli_clone_command_username_intersection(temp_usernames_file):
         assert result.exit_code == 0
         # verify the mocked function was called only for existing username
         assert mock_clone_repo.call_count == 1
+
+
+def test_clone_repo_for_user_clones_one_repository(progress):
+    """Test that clone_repo_for_user clones the repository of one user."""
+    with patch("reporover.main.clone_repo_gitpython") as mock_clone_repo:
+        mock_clone_repo.return_value = StatusCode.WORKING
+        status_codes = clone_repo_for_user(
+            "student1",
+            github_org_url="https://github.com/org",
+            repo_prefix="repo",
+            token_pool=TokenPool(["token"], RateLimiter(10, 20)),
+            destination_directory=Path("/tmp/cloned-repos"),
+            progress=progress,
+            shallow=True,
+        )
+    assert status_codes == [StatusCode.WORKING]
+    assert mock_clone_repo.call_args[0][2] == "student1"
+    assert mock_clone_repo.call_args[0][4] == Path("/tmp/cloned-repos")
+    assert mock_clone_repo.call_args[0][6] is True
+
+
+def test_cli_clone_command_with_no_shallow(temp_usernames_file):
+    """Test the clone command passes the full history option to the clone."""
+    # mock the functions called by the CLI
+    with patch("reporover.main.clone_repo_gitpython") as mock_clone_repo:
+        # configure the mock to simulate success
+        mock_clone_repo.return_value = StatusCode.WORKING
+        # define the command arguments that ask for the full history
+        result = runner.invoke(
+            app,
+            [
+                "clone",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "github_access_token_fake_1234",
+                "/tmp/cloned-repos",
+                "--username",
+                "gkapfham",
+                "--no-shallow",
+            ],
+        )
+        # verify the command executed successfully
+        assert result.exit_code == 0
+        # verify that the clone was not shallow
+        assert mock_clone_repo.call_args[0][6] is False
+
+
+def test_cli_clone_command_with_concurrency(temp_usernames_file):
+    """Test the clone command passes the concurrency limit to the runner."""
+    # mock the functions called by the CLI
+    with patch("reporover.main.run_for_usernames") as mock_run:
+        # configure the mock to simulate success for one user
+        mock_run.return_value = [[StatusCode.WORKING]]
+        # define the command arguments with a smaller concurrency
+        result = runner.invoke(
+            app,
+            [
+                "clone",
+                "https://github.com/Allegheny-Computer-Science-202-S2025/",
+                "computer-science-202-algorithm-analysis-executable-exam-3",
+                str(temp_usernames_file),
+                "github_access_token_fake_1234",
+                "/tmp/cloned-repos",
+                "--username",
+                "gkapfham",
+                "--concurrency",
+                "6",
+            ],
+        )
+        # verify the command executed successfully
+        assert result.exit_code == 0
+        # verify the runner received the concurrency limit
+        assert mock_run.call_args[0][4] == 6
@@ -4,6 +4,7 @@ import json
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from reporover.constants import (
     GitHubAccessLevel,
@@ -45,7 +46,7 @@ def test_leave_pr_comment_success_with_access_level(
     # create mock POST function
     mock_post = Mock(return_value=mock_response)
     # call the function with patch
-    with patch("reporover.pullrequest.requests.post", mock_post):
+    with patch("reporover.pullrequest.github_session.post", mock_post):
         leave_pr_comment(
             github_organization_url=sample_request_data[
                 "github_organization_url"
@@ -91,7 +92,7 @@ def test_leave_pr_comment_success_without_access_level(
     # create mock POST function
     mock_post = Mock(return_value=mock_response)
     # call the function with patch and no access level
-    with patch("reporover.pullrequest.requests.post", mock_post):
+    with patch("reporover.pullrequest.github_session.post", mock_post):
         leave_pr_comment(
             github_organization_url=sample_request_data[
                 "github_organization_url"
@@ -132,7 +133,7 @@ def test_leave_pr_comment_failure(mock_progress, sample_request_data):
     mock_post = Mock(return_value=mock_response)
     # mock the print_json_string function
     with patch("reporover.pullrequest.print_json_string") as mock_print_json:
-        with patch("reporover.pullrequest.requests.post", mock_post):
+        with patch("reporover.pullrequest.github_session.post", mock_post):
             leave_pr_comment(
                 github_organization_url=sample_request_data[
                     "github_organization_url"
@@ -177,7 +178,7 @@ def test_leave_pr_comment_different_access_levels(
         # create mock POST function
         mock_post = Mock(return_value=mock_response)
         # call the function with patch
-        with patch("reporover.pullrequest.requests.post", mock_post):
+        with patch("reporover.pullrequest.github_session.post", mock_post):
             leave_pr_comment(
                 github_organization_url=sample_request_data[
                     "github_organization_url"
@@ -219,7 +220,7 @@ def test_leave_pr_comment_url_parsing(mock_progress):
         # create mock POST function
         mock_post = Mock(return_value=mock_response)
         # call the function with patch
-        with patch("reporover.pullrequest.requests.post", mock_post):
+        with patch("reporover.pullrequest.github_session.post", mock_post):
             leave_pr_comment(
                 github_organization_url=case["url"],
                 repo_prefix="hw",
@@ -264,7 +265,7 @@ def test_leave_pr_comment_repository_name_construction(
         # create mock POST function
         mock_post = Mock(return_value=mock_response)
         # call the function with patch
-        with patch("reporover.pullrequest.requests.post", mock_post):
+        with patch("reporover.pullrequest.github_session.post", mock_post):
             leave_pr_comment(
                 github_organization_url=sample_request_data[
                     "github_organization_url"
@@ -291,7 +292,7 @@ def test_leave_pr_comment_headers_and_data(mock_progress, sample_request_data):
     # create mock POST function
     mock_post = Mock(return_value=mock_response)
     # call the function with patch
-    with patch("reporover.pullrequest.requests.post", mock_post):
+    with patch("reporover.pullrequest.github_session.post", mock_post):
         leave_pr_comment(
             github_organization_url=sample_request_data[
                 "github_organization_url"
@@ -330,7 +331,7 @@ def test_leave_pr_comment_different_pr_numbers(
         # create mock POST function
         mock_post = Mock(return_value=mock_response)
         # call the function with patch
-        with patch("reporover.pullrequest.requests.post", mock_post):
+        with patch("reporover.pullrequest.github_session.post", mock_post):
             leave_pr_comment(
                 github_organization_url=sample_request_data[
                     "github_organization_url"
@@ -373,7 +374,7 @@ def test_leave_pr_comment_various_status_codes(
         mock_post = Mock(return_value=mock_response)
         # mock the print_json_string function
         with patch("reporover.pullrequest.print_json_string"):
-            with patch("reporover.pullrequest.requests.post", mock_post):
+            with patch("reporover.pullrequest.github_session.post", mock_post):
                 leave_pr_comment(
                     github_organization_url=sample_request_data[
                         "github_organization_url"
@@ -401,7 +402,7 @@ def test_leave_pr_comment_message_formatting_with_access_level(
     # create mock POST function
     mock_post = Mock(return_value=mock_response)
     # call the function with patch
-    with patch("reporover.pullrequest.requests.post", mock_post):
+    with patch("reporover.pullrequest.github_session.post", mock_post):
         leave_pr_comment(
             github_organization_url=sample_request_data[
                 "github_organization_url"
@@ -438,7 +439,7 @@ def test_leave_pr_comment_message_formatting_without_access_level(
     # create mock POST function
     mock_post = Mock(return_value=mock_response)
     # call the function with patch
-    with patch("reporover.pullrequest.requests.post", mock_post):
+    with patch("reporover.pullrequest.github_session.post", mock_post):
         leave_pr_comment(
             github_organization_url=sample_request_data[
                 "github_organization_url"
@@ -459,3 +460,27 @@ def test_leave_pr_comment_message_formatting_without_access_level(
     # verify access level phrases are not included
     assert PullRequestMessages.MODIFIED_TO_PHRASE.value not in message_body
     assert PullRequestMessages.ASSISTANCE_SENTENCE.value not in message_body
+
+
+def test_leave_pr_comment_timeout(mock_progress, sample_request_data):
+    """Test that a timeout is a failure for the pull request comment."""
+    # create mock POST function that times out
+    mock_post = Mock(side_effect=requests.Timeout("read timed out"))
+    with patch("reporover.pullrequest.github_session.post", mock_post):
+        result = leave_pr_comment(
+            github_organization_url=sample_request_data[
+                "github_organization_url"
+            ],
+            repo_prefix=sample_request_data["repo_prefix"],
+            username=sample_request_data["username"],
+            access_level=sample_request_data["access_level"],
+            message=sample_request_data["message"],
+            pr_number=sample_request_data["pr_number"],
+            token=sample_request_data["token"],
+            progress=mock_progress,
+        )
+    # verify failure status and the diagnostic message
+    assert result == StatusCode.FAILURE
+    error_message = mock_progress.console.print.call_args[0][0]
+    assert "Failed to comment on pull request 1" in error_message
+    assert "read timed out" in error_message
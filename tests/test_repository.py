@@ -5,15 +5,23 @@
 import base64
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, mock_open, patch
 
+import orjson
 import pytest
+import requests
 from git.exc import GitCommandError
 
+from reporover.cache import read_cached_response, write_cached_response
 from reporover.constants import (
     StatusCode,
 )
-from reporover.repository import clone_repo_gitpython, commit_files_to_repo
+from reporover.repository import (
+    clone_repo_gitpython,
+    commit_files_to_repo,
+    encode_file_content,
+    get_file_shas,
+)
 
 
 @pytest.fixture
@@ -58,9 +66,9 @@ def test_commit_files_to_repo_success_new_files(
     mock_get = Mock(return_value=mock_get_response)
     mock_put = Mock(return_value=mock_put_response)
     # mock file reading
-    with patch("pathlib.Path.read_bytes", return_value=mock_file_content):
-        with patch("reporover.repository.requests.get", mock_get):
-            with patch("reporover.repository.requests.put", mock_put):
+    with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
+        with patch("reporover.repository.github_session.get", mock_get):
+            with patch("reporover.repository.github_session.put", mock_put):
                 commit_files_to_repo(
                     github_organization_url=sample_request_data[
                         "github_organization_url"
@@ -76,8 +84,9 @@ def test_commit_files_to_repo_success_new_files(
                     ],
                     progress=mock_progress,
                 )
-    # verify API calls were made correctly
-    assert mock_get.call_count == 2
+    # verify API calls were made correctly with one
+    # listing of the directory for all of the files
+    assert mock_get.call_count == 1
     assert mock_put.call_count == 2
     # verify success messages were printed
     assert mock_progress.console.print.call_count == 2
@@ -95,16 +104,22 @@ def test_commit_files_to_repo_success_existing_files(
     # create mock responses for existing files
     mock_get_response = Mock()
     mock_get_response.status_code = StatusCode.WORKING.value
-    mock_get_response.json.return_value = {"sha": "abc123"}
+    mock_get_response.headers = {}
+    mock_get_response.content = orjson.dumps(
+        [
+            {"path": "src/test.txt", "sha": "abc123"},
+            {"path": "src/main.py", "sha": "abc123"},
+        ]
+    )
     mock_put_response = Mock()
     mock_put_response.status_code = StatusCode.WORKING.value
     # create mock functions
     mock_get = Mock(return_value=mock_get_response)
     mock_put = Mock(return_value=mock_put_response)
     # mock file reading
-    with patch("pathlib.Path.read_bytes", return_value=mock_file_content):
-        with patch("reporover.repository.requests.get", mock_get):
-            with patch("reporover.repository.requests.put", mock_put):
+    with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
+        with patch("reporover.repository.github_session.get", mock_get):
+            with patch("reporover.repository.github_session.put", mock_put):
                 commit_files_to_repo(
                     github_organization_url=sample_request_data[
                         "github_organization_url"
@@ -142,12 +157,14 @@ def test_commit_files_to_repo_failure(
     mock_get = Mock(return_value=mock_get_response)
     mock_put = Mock(return_value=mock_put_response)
     # mock file reading and print_json_string
-    with patch("pathlib.Path.read_bytes", return_value=mock_file_content):
+    with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
         with patch(
             "reporover.repository.print_json_string"
         ) as mock_print_json:
-            with patch("reporover.repository.requests.get", mock_get):
-                with patch("reporover.repository.requests.put", mock_put):
+            with patch("reporover.repository.github_session.get", mock_get):
+                with patch(
+                    "reporover.repository.github_session.put", mock_put
+                ):
                     commit_files_to_repo(
                         github_organization_url=sample_request_data[
                             "github_organization_url"
@@ -199,9 +216,13 @@ def test_commit_files_to_repo_url_parsing(mock_progress, mock_file_content):
         mock_get = Mock(return_value=mock_get_response)
         mock_put = Mock(return_value=mock_put_response)
         # mock file reading
-        with patch("pathlib.Path.read_bytes", return_value=mock_file_content):
-            with patch("reporover.repository.requests.get", mock_get):
-                with patch("reporover.repository.requests.put", mock_put):
+        with patch(
+            "pathlib.Path.open", mock_open(read_data=mock_file_content)
+        ):
+            with patch("reporover.repository.github_session.get", mock_get):
+                with patch(
+                    "reporover.repository.github_session.put", mock_put
+                ):
                     commit_files_to_repo(
                         github_organization_url=case["url"],
                         repo_prefix="hw",
@@ -252,9 +273,13 @@ def test_commit_files_to_repo_repository_name_construction(
         mock_get = Mock(return_value=mock_get_response)
         mock_put = Mock(return_value=mock_put_response)
         # mock file reading
-        with patch("pathlib.Path.read_bytes", return_value=mock_file_content):
-            with patch("reporover.repository.requests.get", mock_get):
-                with patch("reporover.repository.requests.put", mock_put):
+        with patch(
+            "pathlib.Path.open", mock_open(read_data=mock_file_content)
+        ):
+            with patch("reporover.repository.github_session.get", mock_get):
+                with patch(
+                    "reporover.repository.github_session.put", mock_put
+                ):
                     commit_files_to_repo(
                         github_organization_url="https://github.com/test-org/repo",
                         repo_prefix=case["prefix"],
@@ -289,9 +314,9 @@ def test_commit_files_to_repo_file_encoding(
     mock_get = Mock(return_value=mock_get_response)
     mock_put = Mock(return_value=mock_put_response)
     # mock file reading
-    with patch("pathlib.Path.read_bytes", return_value=test_content):
-        with patch("reporover.repository.requests.get", mock_get):
-            with patch("reporover.repository.requests.put", mock_put):
+    with patch("pathlib.Path.open", mock_open(read_data=test_content)):
+        with patch("reporover.repository.github_session.get", mock_get):
+            with patch("reporover.repository.github_session.put", mock_put):
                 commit_files_to_repo(
                     github_organization_url=sample_request_data[
                         "github_organization_url"
@@ -326,9 +351,9 @@ def test_commit_files_to_repo_headers_and_data(
     mock_get = Mock(return_value=mock_get_response)
     mock_put = Mock(return_value=mock_put_response)
     # mock file reading
-    with patch("pathlib.Path.read_bytes", return_value=mock_file_content):
-        with patch("reporover.repository.requests.get", mock_get):
-            with patch("reporover.repository.requests.put", mock_put):
+    with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
+        with patch("reporover.repository.github_session.get", mock_get):
+            with patch("reporover.repository.github_session.put", mock_put):
                 commit_files_to_repo(
                     github_organization_url=sample_request_data[
                         "github_organization_url"
@@ -374,9 +399,9 @@ def test_commit_files_to_repo_destination_path_construction(
     mock_get = Mock(return_value=mock_get_response)
     mock_put = Mock(return_value=mock_put_response)
     # mock file reading
-    with patch("pathlib.Path.read_bytes", return_value=mock_file_content):
-        with patch("reporover.repository.requests.get", mock_get):
-            with patch("reporover.repository.requests.put", mock_put):
+    with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
+        with patch("reporover.repository.github_session.get", mock_get):
+            with patch("reporover.repository.github_session.put", mock_put):
                 commit_files_to_repo(
                     github_organization_url=sample_request_data[
                         "github_organization_url"
@@ -393,19 +418,27 @@ def test_commit_files_to_repo_destination_path_construction(
     # verify correct destination path in API URLs
     get_call_args = mock_get.call_args
     put_call_args = mock_put.call_args
-    expected_path_suffix = "docs/examples/test.txt"
-    assert expected_path_suffix in get_call_args[0][0]
-    assert expected_path_suffix in put_call_args[0][0]
+    assert get_call_args[0][0].endswith("contents/docs/examples")
+    assert put_call_args[0][0].endswith("contents/docs/examples/test.txt")
 
 
 def test_commit_files_to_repo_file_read_error(
     mock_progress, sample_request_data
 ):
     """Test file commit failure when file cannot be read."""
+    # create mock response for a directory that does not exist
+    mock_get_response = Mock()
+    mock_get_response.status_code = StatusCode.NOT_FOUND.value
     # mock file reading to raise FileNotFoundError
-    with patch(
-        "pathlib.Path.read_bytes",
-        side_effect=FileNotFoundError("File not found"),
+    with (
+        patch(
+            "pathlib.Path.open",
+            side_effect=FileNotFoundError("File not found"),
+        ),
+        patch(
+            "reporover.repository.github_session.get",
+            Mock(return_value=mock_get_response),
+        ),
     ):
         result = commit_files_to_repo(
             github_organization_url=sample_request_data[
@@ -429,10 +462,264 @@ def test_commit_files_to_repo_file_read_error(
     assert "nonexistent.txt" in error_message
 
 
+def test_commit_files_to_repo_connection_error(
+    mock_progress, sample_request_data, mock_file_content
+):
+    """Test that a connection error while committing is a failure."""
+    # create mock responses where the listing works and the commit fails
+    mock_get_response = Mock()
+    mock_get_response.status_code = StatusCode.NOT_FOUND.value
+    mock_get = Mock(return_value=mock_get_response)
+    mock_put = Mock(side_effect=requests.ConnectionError("connection reset"))
+    with (
+        patch("pathlib.Path.open", mock_open(read_data=mock_file_content)),
+        patch("reporover.repository.github_session.get", mock_get),
+        patch("reporover.repository.github_session.put", mock_put),
+    ):
+        result = commit_files_to_repo(
+            github_organization_url=sample_request_data[
+                "github_organization_url"
+            ],
+            repo_prefix=sample_request_data["repo_prefix"],
+            username=sample_request_data["username"],
+            token=sample_request_data["token"],
+            directory=sample_request_data["directory"],
+            files=sample_request_data["files"],
+            commit_message=sample_request_data["commit_message"],
+            destination_directory=sample_request_data["destination_directory"],
+            progress=mock_progress,
+        )
+    # verify that the first failed commit stops the other files
+    assert result == StatusCode.FAILURE
+    assert mock_put.call_count == 1
+    error_message = mock_progress.console.print.call_args[0][0]
+    assert "Failed to commit test.txt" in error_message
+    assert "connection reset" in error_message
+
+
+def test_commit_files_to_repo_listing_timeout(
+    mock_progress, sample_request_data
+):
+    """Test that a timeout while listing the directory is a failure."""
+    mock_get = Mock(side_effect=requests.Timeout("read timed out"))
+    mock_put = Mock()
+    with (
+        patch("reporover.repository.github_session.get", mock_get),
+        patch("reporover.repository.github_session.put", mock_put),
+    ):
+        result = commit_files_to_repo(
+            github_organization_url=sample_request_data[
+                "github_organization_url"
+            ],
+            repo_prefix=sample_request_data["repo_prefix"],
+            username=sample_request_data["username"],
+            token=sample_request_data["token"],
+            directory=sample_request_data["directory"],
+            files=sample_request_data["files"],
+            commit_message=sample_request_data["commit_message"],
+            destination_directory=sample_request_data["destination_directory"],
+            progress=mock_progress,
+        )
+    assert result == StatusCode.FAILURE
+    mock_put.assert_not_called()
+    error_message = mock_progress.console.print.call_args[0][0]
+    assert "Failed to list directory 'src'" in error_message
+
+
+def test_commit_files_to_repo_commits_files_in_order(mock_progress, tmp_path):
+    """Test that the files encoded ahead of time are committed in order."""
+    # create the files with different content
+    for name in ["a.txt", "b.txt", "c.txt"]:
+        (tmp_path / name).write_bytes(name.encode())
+    mock_get_response = Mock()
+    mock_get_response.status_code = StatusCode.NOT_FOUND.value
+    mock_put_response = Mock()
+    mock_put_response.status_code = StatusCode.CREATED.value
+    mock_put = Mock(return_value=mock_put_response)
+    with (
+        patch(
+            "reporover.repository.github_session.get",
+            Mock(return_value=mock_get_response),
+        ),
+        patch("reporover.repository.github_session.put", mock_put),
+    ):
+        result = commit_files_to_repo(
+            github_organization_url="https://github.com/test-org/repo",
+            repo_prefix="hw",
+            username="student",
+            token="token",
+            directory=tmp_path,
+            files=[Path("a.txt"), Path("b.txt"), Path("c.txt")],
+            commit_message="Add files",
+            destination_directory=Path("src"),
+            progress=mock_progress,
+        )
+    assert result == StatusCode.WORKING
+    # verify that each commit has the content of its own file
+    for call, name in zip(mock_put.call_args_list, ["a", "b", "c"]):
+        assert call[0][0].endswith(f"src/{name}.txt")
+        content = base64.b64decode(call[1]["json"]["content"])
+        assert content == f"{name}.txt".encode()
+
+
+def test_commit_files_to_repo_stops_at_unreadable_later_file(
+    mock_progress, tmp_path
+):
+    """Test that a file that cannot be read stops the later commits."""
+    # create the first file but not the second one
+    (tmp_path / "a.txt").write_bytes(b"a")
+    mock_get_response = Mock()
+    mock_get_response.status_code = StatusCode.NOT_FOUND.value
+    mock_put_response = Mock()
+    mock_put_response.status_code = StatusCode.CREATED.value
+    mock_put = Mock(return_value=mock_put_response)
+    with (
+        patch(
+            "reporover.repository.github_session.get",
+            Mock(return_value=mock_get_response),
+        ),
+        patch("reporover.repository.github_session.put", mock_put),
+    ):
+        result = commit_files_to_repo(
+            github_organization_url="https://github.com/test-org/repo",
+            repo_prefix="hw",
+            username="student",
+            token="token",
+            directory=tmp_path,
+            files=[Path("a.txt"), Path("missing.txt")],
+            commit_message="Add files",
+            destination_directory=Path("src"),
+            progress=mock_progress,
+        )
+    # verify that only the first file was committed
+    assert result == StatusCode.FAILURE
+    assert mock_put.call_count == 1
+    error_message = mock_progress.console.print.call_args[0][0]
+    assert "Failed to read file missing.txt" in error_message
+
+
+def test_encode_file_content_matches_whole_file_encoding(tmp_path):
+    """Test that encoding in chunks matches encoding the whole file."""
+    # use a size that is not a multiple of the chunk size
+    # or of three so that the last chunk needs padding
+    content = bytes(range(256)) * 700 + b"end"
+    file_path = tmp_path / "large.bin"
+    file_path.write_bytes(content)
+    assert encode_file_content(file_path) == base64.b64encode(content).decode()
+
+
+def test_encode_file_content_empty_file(tmp_path):
+    """Test that an empty file encodes to an empty string."""
+    file_path = tmp_path / "empty.txt"
+    file_path.write_bytes(b"")
+    assert encode_file_content(file_path) == ""
+
+
+def test_get_file_shas_maps_paths_to_shas():
+    """Test that one directory listing provides the SHA of each file."""
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.headers = {}
+    mock_response.content = orjson.dumps(
+        [
+            {"path": "src/a.txt", "sha": "sha-a", "type": "file"},
+            {"path": "src/b.txt", "sha": "sha-b", "type": "file"},
+        ]
+    )
+    mock_get = Mock(return_value=mock_response)
+    with patch("reporover.repository.github_session.get", mock_get):
+        file_shas = get_file_shas(
+            "https://api.github.com/repos/org/repo/contents/",
+            Path("src"),
+            {"Authorization": "token t"},
+        )
+    assert file_shas == {"src/a.txt": "sha-a", "src/b.txt": "sha-b"}
+    mock_get.assert_called_once_with(
+        "https://api.github.com/repos/org/repo/contents/src",
+        headers={"Authorization": "token t"},
+    )
+
+
+def test_get_file_shas_lists_root_of_repository():
+    """Test that the root of the repository is listed with an empty path."""
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.headers = {}
+    mock_response.content = orjson.dumps([{"path": "a.txt", "sha": "sha-a"}])
+    mock_get = Mock(return_value=mock_response)
+    with patch("reporover.repository.github_session.get", mock_get):
+        file_shas = get_file_shas(
+            "https://api.github.com/repos/org/repo/contents/", Path("."), {}
+        )
+    assert file_shas == {"a.txt": "sha-a"}
+    assert (
+        mock_get.call_args[0][0]
+        == "https://api.github.com/repos/org/repo/contents/"
+    )
+
+
+def test_get_file_shas_missing_directory_or_file_path():
+    """Test that a missing directory or a file path yields no SHAs."""
+    mock_missing = Mock()
+    mock_missing.status_code = StatusCode.NOT_FOUND.value
+    mock_file = Mock()
+    mock_file.status_code = StatusCode.WORKING.value
+    mock_file.headers = {}
+    mock_file.content = orjson.dumps({"path": "src", "sha": "sha-src"})
+    for mock_response in [mock_missing, mock_file]:
+        with patch(
+            "reporover.repository.github_session.get",
+            Mock(return_value=mock_response),
+        ):
+            assert get_file_shas("https://api/", Path("src"), {}) == {}
+
+
+def test_get_file_shas_stores_etag():
+    """Test that a listing with an ETag is stored in the cache."""
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.headers = {"ETag": '"abc"'}
+    mock_response.content = orjson.dumps(
+        [{"path": "src/a.txt", "sha": "sha-a"}]
+    )
+    with patch(
+        "reporover.repository.github_session.get",
+        Mock(return_value=mock_response),
+    ):
+        get_file_shas("https://api/contents/", Path("src"), {})
+    assert read_cached_response("https://api/contents/src") == {
+        "etag": '"abc"',
+        "body": {"src/a.txt": "sha-a"},
+    }
+
+
+def test_get_file_shas_not_modified_uses_cache():
+    """Test that a not modified listing reuses the cached SHAs."""
+    write_cached_response(
+        "https://api/contents/src", '"abc"', {"src/a.txt": "sha-a"}
+    )
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.NOT_MODIFIED.value
+    mock_get = Mock(return_value=mock_response)
+    with (
+        patch("reporover.repository.github_session.get", mock_get),
+        patch("reporover.repository.load_response_json") as mock_load,
+    ):
+        file_shas = get_file_shas(
+            "https://api/contents/", Path("src"), {"Authorization": "token t"}
+        )
+    assert file_shas == {"src/a.txt": "sha-a"}
+    assert mock_get.call_args[1]["headers"] == {
+        "Authorization": "token t",
+        "If-None-Match": '"abc"',
+    }
+    mock_load.assert_not_called()
+
+
 def test_clone_repo_gitpython_success(mock_progress):
     """Test successful repository cloning."""
     # create mock for Repo.clone_from
-    with patch("reporover.repository.Repo.clone_from") as mock_clone:
+    with patch("git.Repo.clone_from") as mock_clone:
         # configure the mock to simulate successful cloning
         mock_clone.return_value = Mock()
         # call the function
@@ -450,7 +737,9 @@ def test_clone_repo_gitpython_success(mock_progress):
         expected_clone_url = "https://test_token_123@github.com/test-org/assignment-testuser.git"
         expected_destination = Path("/tmp/assignment-testuser")
         mock_clone.assert_called_once_with(
-            expected_clone_url, expected_destination
+            expected_clone_url,
+            expected_destination,
+            multi_options=["--depth=1", "--single-branch", "--no-tags"],
         )
         # verify success message was printed
         mock_progress.console.print.assert_called()
@@ -458,10 +747,26 @@ def test_clone_repo_gitpython_success(mock_progress):
         assert "Cloned assignment-testuser" in success_message
 
 
+def test_clone_repo_gitpython_full_history(mock_progress):
+    """Test that cloning without the shallow option fetches the full history."""
+    with patch("git.Repo.clone_from") as mock_clone:
+        result = clone_repo_gitpython(
+            github_organization_url="https://github.com/test-org/repo",
+            repo_prefix="assignment",
+            username="testuser",
+            token="test_token_123",
+            destination_directory=Path("/tmp"),
+            progress=mock_progress,
+            shallow=False,
+        )
+        assert result == StatusCode.WORKING
+        assert mock_clone.call_args.kwargs["multi_options"] == []
+
+
 def test_clone_repo_gitpython_git_command_error(mock_progress):
     """Test repository cloning failure with GitCommandError."""
     # create mock for git.Repo.clone_from that raises GitCommandError
-    with patch("reporover.repository.Repo.clone_from") as mock_clone:
+    with patch("git.Repo.clone_from") as mock_clone:
         # configure the mock to raise GitCommandError
         mock_clone.side_effect = GitCommandError(
             "clone", "Repository not found"
@@ -503,7 +808,7 @@ def test_clone_repo_gitpython_url_parsing(mock_progress):
     ]
     for case in test_cases:
         # create mock for git.Repo.clone_from
-        with patch("reporover.repository.Repo.clone_from") as mock_clone:
+        with patch("git.Repo.clone_from") as mock_clone:
             # configure the mock to simulate successful cloning
             mock_clone.return_value = Mock()
             # call the function
@@ -542,7 +847,7 @@ def test_clone_repo_gitpython_repository_name_construction(mock_progress):
     ]
     for case in test_cases:
         # create mock for git.Repo.clone_from
-        with patch("reporover.repository.Repo.clone_from") as mock_clone:
+        with patch("git.Repo.clone_from") as mock_clone:
             # configure the mock to simulate successful cloning
             mock_clone.return_value = Mock()
             # call the function
@@ -567,7 +872,7 @@ def test_clone_repo_gitpython_repository_name_construction(mock_progress):
 def test_clone_repo_gitpython_destination_path_construction(mock_progress):
     """Test proper destination path construction."""
     # create mock for git.Repo.clone_from
-    with patch("reporover.repository.Repo.clone_from") as mock_clone:
+    with patch("git.Repo.clone_from") as mock_clone:
         # configure the mock to simulate successful cloning
         mock_clone.return_value = Mock()
         # call the function with specific directory
@@ -588,7 +893,7 @@ def test_clone_repo_gitpython_destination_path_construction(mock_progress):
 def test_clone_repo_gitpython_token_authentication(mock_progress):
     """Test proper token authentication in clone URL."""
     # create mock for git.Repo.clone_from
-    with patch("reporover.repository.Repo.clone_from") as mock_clone:
+    with patch("git.Repo.clone_from") as mock_clone:
         # configure the mock to simulate successful cloning
         mock_clone.return_value = Mock()
         # call the function with specific token
@@ -610,7 +915,7 @@ def test_clone_repo_gitpython_directory_already_exists(mock_progress):
     """Test repository cloning failure when destination directory already exists."""
     # create mock for git.Repo.clone_from and Path.exists
     with (
-        patch("reporover.repository.Repo.clone_from") as mock_clone,
+        patch("git.Repo.clone_from") as mock_clone,
         patch("pathlib.Path.exists") as mock_exists,
     ):
         # configure the mock to simulate directory already exists
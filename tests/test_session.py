@@ -0,0 +1,412 @@
+"""Test cases for the session module."""
+
+# ruff: noqa: PLR2004
+
+from unittest.mock import Mock, patch
+
+import requests
+
+from reporover.constants import (
+    GitHubRateLimitDetails,
+    GitHubSessionDetails,
+    StatusCode,
+)
+from reporover.session import (
+    GitHubSession,
+    RateLimiter,
+    TokenPool,
+    create_session,
+    get_rate_limit_resource,
+    get_retry_delay,
+    github_session,
+    is_rate_limited,
+)
+
+
+def create_response(status_code: int, headers: dict, text: str = "") -> Mock:
+    """Create a mock response with a status code and headers."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers
+    response.text = text
+    return response
+
+
+def test_rate_limiter_does_not_wait_with_tokens():
+    """Test that the rate limiter does not wait when the bucket has tokens."""
+    rate_limiter = RateLimiter(rate=10, capacity=2)
+    with patch("reporover.session.time.sleep") as mock_sleep:
+        rate_limiter.acquire()
+        rate_limiter.acquire()
+    mock_sleep.assert_not_called()
+
+
+def test_rate_limiter_waits_when_bucket_is_empty():
+    """Test that the rate limiter waits for a token when the bucket is empty."""
+    rate_limiter = RateLimiter(rate=10, capacity=1)
+    with (
+        patch("reporover.session.time.monotonic", return_value=100.0),
+        patch("reporover.session.time.sleep") as mock_sleep,
+    ):
+        rate_limiter.updated = 100.0
+        rate_limiter.acquire()
+        rate_limiter.acquire()
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args[0][0] == 0.1
+
+
+def test_rate_limiter_update_from_headers_shrinks_tokens():
+    """Test that the remaining rate limit shrinks the bucket of tokens."""
+    rate_limiter = RateLimiter(rate=10, capacity=20)
+    rate_limiter.update_from_headers(
+        {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "0"}
+    )
+    assert rate_limiter.tokens == 5
+
+
+def test_rate_limiter_update_from_headers_records_exhausted_token():
+    """Test that an exhausted rate limit is recorded for its authorization."""
+    rate_limiter = RateLimiter(rate=10, capacity=20)
+    rate_limiter.update_from_headers(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"},
+        "token first",
+    )
+    assert rate_limiter.get_reset_time("token first") == 1030.0
+    assert rate_limiter.get_reset_time("token second") == 0.0
+
+
+def test_rate_limiter_waits_for_reset_of_exhausted_token():
+    """Test that a request with an exhausted token waits for the reset."""
+    rate_limiter = RateLimiter(rate=10, capacity=20)
+    rate_limiter.rate_limits[("token first", "core")] = (0, 1030.0)
+    with (
+        patch("reporover.session.time.time", return_value=1000.0),
+        patch("reporover.session.time.sleep") as mock_sleep,
+    ):
+        rate_limiter.acquire("token second")
+        mock_sleep.assert_not_called()
+        rate_limiter.acquire("token first")
+    mock_sleep.assert_called_once_with(30.0)
+
+
+def test_rate_limiter_has_remaining_until_reserve():
+    """Test that an authorization below the reserve has no remaining requests."""
+    rate_limiter = RateLimiter(rate=10, capacity=20)
+    rate_limiter.rate_limits[("token first", "core")] = (49, 1030.0)
+    rate_limiter.rate_limits[("token second", "core")] = (50, 1030.0)
+    with patch("reporover.session.time.time", return_value=1000.0):
+        assert not rate_limiter.has_remaining("token first", 50)
+        assert rate_limiter.has_remaining("token second", 50)
+        assert rate_limiter.has_remaining("token third", 50)
+    with patch("reporover.session.time.time", return_value=1030.0):
+        assert rate_limiter.has_remaining("token first", 50)
+
+
+def test_rate_limiter_tracks_each_resource_separately():
+    """Test that an exhausted GraphQL limit does not stop REST requests."""
+    rate_limiter = RateLimiter(rate=10, capacity=20)
+    rate_limiter.update_from_headers(
+        {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "1030",
+            "X-RateLimit-Resource": "graphql",
+        },
+        "token first",
+    )
+    assert rate_limiter.tokens == 20
+    assert rate_limiter.get_reset_time("token first", "graphql") == 1030.0
+    assert rate_limiter.get_reset_time("token first") == 0.0
+    with (
+        patch("reporover.session.time.time", return_value=1000.0),
+        patch("reporover.session.time.sleep") as mock_sleep,
+    ):
+        assert rate_limiter.has_remaining("token first", 50)
+        assert not rate_limiter.has_remaining("token first", 50, "graphql")
+        rate_limiter.acquire("token first")
+        mock_sleep.assert_not_called()
+        rate_limiter.acquire("token first", "graphql")
+    mock_sleep.assert_called_once_with(30.0)
+
+
+def test_rate_limiter_update_from_headers_ignores_missing_headers():
+    """Test that responses without rate limit headers leave the bucket alone."""
+    rate_limiter = RateLimiter(rate=10, capacity=20)
+    rate_limiter.update_from_headers({})
+    assert rate_limiter.tokens == 20
+    assert rate_limiter.rate_limits == {}
+
+
+def test_token_pool_rotates_tokens():
+    """Test that the token pool cycles through the tokens in order."""
+    token_pool = TokenPool(["first", "second"], RateLimiter(10, 20))
+    assert token_pool.next_token() == "first"
+    assert token_pool.next_token() == "second"
+    assert token_pool.next_token() == "first"
+
+
+def test_token_pool_skips_nearly_exhausted_token():
+    """Test that the token pool skips a token with too few remaining requests."""
+    rate_limiter = RateLimiter(10, 20)
+    rate_limiter.rate_limits[("token first", "core")] = (10, 1030.0)
+    token_pool = TokenPool(["first", "second"], rate_limiter)
+    with patch("reporover.session.time.time", return_value=1000.0):
+        assert token_pool.next_token() == "second"
+        assert token_pool.next_token() == "second"
+
+
+def test_token_pool_chooses_earliest_reset_when_all_exhausted():
+    """Test that the token pool picks the token that resets first."""
+    rate_limiter = RateLimiter(10, 20)
+    rate_limiter.rate_limits[("token first", "core")] = (0, 1060.0)
+    rate_limiter.rate_limits[("token second", "core")] = (0, 1030.0)
+    token_pool = TokenPool(["first", "second"], rate_limiter)
+    with patch("reporover.session.time.time", return_value=1000.0):
+        assert token_pool.next_token() == "second"
+
+
+def test_is_rate_limited_too_many_requests():
+    """Test that too many requests counts as a rate limit."""
+    response = create_response(StatusCode.TOO_MANY_REQUESTS.value, {})
+    assert is_rate_limited(response)
+
+
+def test_is_rate_limited_forbidden_with_retry_after():
+    """Test that forbidden with a retry delay counts as a rate limit."""
+    response = create_response(
+        StatusCode.FORBIDDEN.value, {"Retry-After": "60"}
+    )
+    assert is_rate_limited(response)
+
+
+def test_is_rate_limited_forbidden_with_no_remaining_requests():
+    """Test that forbidden with no remaining requests counts as a rate limit."""
+    response = create_response(
+        StatusCode.FORBIDDEN.value, {"X-RateLimit-Remaining": "0"}
+    )
+    assert is_rate_limited(response)
+
+
+def test_is_rate_limited_forbidden_without_rate_limit_headers():
+    """Test that forbidden alone is a missing permission, not a rate limit."""
+    response = create_response(StatusCode.FORBIDDEN.value, {})
+    assert not is_rate_limited(response)
+
+
+def test_is_rate_limited_forbidden_secondary_rate_limit():
+    """Test that forbidden with a secondary rate limit message is a rate limit."""
+    response = create_response(
+        StatusCode.FORBIDDEN.value,
+        {"X-RateLimit-Remaining": "4000"},
+        '{"message": "You have exceeded a secondary rate limit. Please wait'
+        + ' a few minutes before you try again."}',
+    )
+    assert is_rate_limited(response)
+
+
+def test_is_rate_limited_success():
+    """Test that a successful response is not rate limited."""
+    response = create_response(StatusCode.SUCCESS.value, {})
+    assert not is_rate_limited(response)
+
+
+def test_get_retry_delay_uses_retry_after():
+    """Test that the retry delay prefers the Retry-After header."""
+    response = create_response(
+        StatusCode.FORBIDDEN.value, {"Retry-After": "30"}
+    )
+    assert get_retry_delay(response, 0) == 30.0
+
+
+def test_get_retry_delay_waits_for_reset():
+    """Test that the retry delay waits until the rate limit resets."""
+    response = create_response(
+        StatusCode.FORBIDDEN.value,
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1045"},
+    )
+    with patch("reporover.session.time.time", return_value=1000.0):
+        assert get_retry_delay(response, 0) == 45.0
+
+
+def test_get_retry_delay_backs_off_exponentially():
+    """Test that the retry delay doubles for each attempt without headers."""
+    response = create_response(StatusCode.TOO_MANY_REQUESTS.value, {})
+    backoff = GitHubRateLimitDetails.BACKOFF_SECONDS.value
+    with patch("reporover.session.random.uniform", return_value=1.0):
+        assert get_retry_delay(response, 0) == backoff
+        assert get_retry_delay(response, 1) == backoff * 2
+        assert get_retry_delay(response, 2) == backoff * 4
+
+
+def test_get_retry_delay_adds_jitter():
+    """Test that the exponential backoff grows by up to half of its length."""
+    response = create_response(StatusCode.TOO_MANY_REQUESTS.value, {})
+    backoff = GitHubRateLimitDetails.BACKOFF_SECONDS.value * 2**2
+    delays = {get_retry_delay(response, 2) for _ in range(20)}
+    assert len(delays) > 1
+    assert all(backoff <= delay <= backoff * 1.5 for delay in delays)
+
+
+def test_get_retry_delay_waits_at_least_one_minute():
+    """Test that the retry delay without headers is at least one minute."""
+    response = create_response(
+        StatusCode.FORBIDDEN.value,
+        {"X-RateLimit-Remaining": "4000"},
+        '{"message": "You have exceeded a secondary rate limit."}',
+    )
+    delays = {get_retry_delay(response, 0) for _ in range(20)}
+    assert all(delay >= 60 for delay in delays)
+
+
+def test_github_session_returns_response_without_retry():
+    """Test that a response that is not rate limited is returned at once."""
+    session = GitHubSession(RateLimiter(rate=10, capacity=20))
+    response = create_response(StatusCode.SUCCESS.value, {})
+    with patch(
+        "reporover.session.requests.Session.request", return_value=response
+    ) as mock_request:
+        result = session.request("PUT", "https://api.github.com/test")
+    assert result is response
+    mock_request.assert_called_once()
+
+
+def test_github_session_sets_default_timeout():
+    """Test that a request without a timeout uses the default timeouts."""
+    session = GitHubSession(RateLimiter(rate=10, capacity=20))
+    response = create_response(StatusCode.SUCCESS.value, {})
+    with patch(
+        "reporover.session.requests.Session.request", return_value=response
+    ) as mock_request:
+        session.request("GET", "https://api.github.com/test")
+        session.request("GET", "https://api.github.com/test", timeout=30)
+    assert mock_request.call_args_list[0][1]["timeout"] == (
+        GitHubSessionDetails.CONNECT_TIMEOUT.value,
+        GitHubSessionDetails.READ_TIMEOUT.value,
+    )
+    assert mock_request.call_args_list[1][1]["timeout"] == 30
+
+
+def test_github_session_retries_rate_limited_request():
+    """Test that a rate-limited request is retried after waiting."""
+    session = GitHubSession(RateLimiter(rate=10, capacity=20))
+    limited_response = create_response(
+        StatusCode.FORBIDDEN.value, {"Retry-After": "2"}
+    )
+    response = create_response(StatusCode.SUCCESS.value, {})
+    with (
+        patch(
+            "reporover.session.requests.Session.request",
+            side_effect=[limited_response, response],
+        ) as mock_request,
+        patch("reporover.session.time.sleep") as mock_sleep,
+    ):
+        result = session.request("PUT", "https://api.github.com/test")
+    assert result is response
+    assert mock_request.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+def test_github_session_tracks_rate_limit_per_token():
+    """Test that the session records an exhausted rate limit for its token."""
+    session = GitHubSession(RateLimiter(rate=10, capacity=20))
+    response = create_response(
+        StatusCode.SUCCESS.value,
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"},
+    )
+    with patch(
+        "reporover.session.requests.Session.request", return_value=response
+    ):
+        session.request(
+            "GET",
+            "https://api.github.com/test",
+            headers={"Authorization": "token first"},
+        )
+    assert session.rate_limiter.get_reset_time("token first") == 1030.0
+    assert session.rate_limiter.get_reset_time("token second") == 0.0
+
+
+def test_get_rate_limit_resource():
+    """Test that GraphQL requests have their own rate limit resource."""
+    assert (
+        get_rate_limit_resource("https://api.github.com/graphql") == "graphql"
+    )
+    assert (
+        get_rate_limit_resource("https://api.github.com/repos/o/r") == "core"
+    )
+
+
+def test_github_session_stops_retrying_after_all_attempts():
+    """Test that the last rate-limited response is returned after all attempts."""
+    session = GitHubSession(RateLimiter(rate=10, capacity=20))
+    limited_response = create_response(StatusCode.TOO_MANY_REQUESTS.value, {})
+    with (
+        patch(
+            "reporover.session.requests.Session.request",
+            return_value=limited_response,
+        ) as mock_request,
+        patch("reporover.session.time.sleep"),
+    ):
+        result = session.request("GET", "https://api.github.com/test")
+    assert result is limited_response
+    assert mock_request.call_count == GitHubRateLimitDetails.ATTEMPTS.value
+
+
+def test_create_session_returns_session():
+    """Test that create_session returns a rate-limited requests session."""
+    session = create_session()
+    assert isinstance(session, requests.Session)
+    assert isinstance(session, GitHubSession)
+    assert (
+        session.rate_limiter.rate
+        == GitHubRateLimitDetails.REQUESTS_PER_SECOND.value
+    )
+    assert (
+        session.rate_limiter.capacity
+        == GitHubRateLimitDetails.BURST_CAPACITY.value
+    )
+
+
+def test_create_session_mounts_pooled_adapter():
+    """Test that the HTTPS adapter keeps a pool of connections."""
+    session = create_session()
+    adapter = session.get_adapter("https://api.github.com")
+    assert (
+        adapter._pool_connections  # type: ignore[attr-defined]
+        == GitHubSessionDetails.POOL_CONNECTIONS.value
+    )
+    assert (
+        adapter._pool_maxsize  # type: ignore[attr-defined]
+        == GitHubSessionDetails.POOL_MAXSIZE.value
+    )
+
+
+def test_create_session_retries_transient_failures():
+    """Test that the HTTPS adapter retries transient server failures."""
+    session = create_session()
+    adapter = session.get_adapter("https://api.github.com")
+    retry = adapter.max_retries  # type: ignore[attr-defined]
+    assert retry.total == GitHubSessionDetails.RETRY_TOTAL.value
+    assert (
+        retry.backoff_factor == GitHubSessionDetails.RETRY_BACKOFF_FACTOR.value
+    )
+    assert (
+        retry.backoff_jitter == GitHubSessionDetails.RETRY_BACKOFF_JITTER.value
+    )
+    assert retry.backoff_max == GitHubSessionDetails.RETRY_BACKOFF_MAX.value
+    assert StatusCode.INTERNAL_SERVER_ERROR.value in retry.status_forcelist
+    assert StatusCode.BAD_GATEWAY.value in retry.status_forcelist
+    assert StatusCode.SERVICE_UNAVAILABLE.value in retry.status_forcelist
+    assert StatusCode.GATEWAY_TIMEOUT.value in retry.status_forcelist
+    assert "PUT" in retry.allowed_methods
+    # a retried comment would appear twice on the pull request
+    assert "POST" not in retry.allowed_methods
+
+
+def test_create_session_sets_accept_header():
+    """Test that the session asks for version three of the GitHub API."""
+    session = create_session()
+    assert session.headers["Accept"] == "application/vnd.github.v3+json"
+
+
+def test_github_session_is_shared_session():
+    """Test that the module provides one shared session."""
+    assert isinstance(github_session, requests.Session)
@@ -1,12 +1,27 @@
 """Test cases the user module."""
 
 import json
+import math
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
+import requests
 
-from reporover.constants import GitHubAccessLevel, StatusCode
-from reporover.user import modify_user_access
+from reporover.constants import (
+    GitHubAccessLevel,
+    GitHubGraphQLDetails,
+    StatusCode,
+)
+from reporover.user import (
+    create_access_levels_query,
+    get_user_access_level,
+    get_user_access_levels,
+    modify_user_access,
+    permission_bodies,
+    plan_access_changes,
+)
+from reporover.util import create_headers
 
 
 @pytest.fixture
@@ -53,10 +68,11 @@ def test_modify_user_access_success(mock_progress, sample_request_data):
     expected_headers = {
         "Authorization": "token test_token_123",
         "Accept": "application/vnd.github.v3+json",
+        "Content-Type": "application/json",
     }
-    expected_data = {"permission": "read"}
+    expected_data = b'{"permission":"read"}'
     mock_put.assert_called_once_with(
-        expected_url, headers=expected_headers, json=expected_data
+        expected_url, headers=expected_headers, data=expected_data
     )
     # verify success message was printed
     mock_progress.console.print.assert_called_once()
@@ -138,7 +154,8 @@ def test_modify_user_access_different_access_levels(
         assert result == StatusCode.SUCCESS
         # verify correct permission was sent
         call_args = mock_put.call_args
-        assert call_args[1]["json"]["permission"] == access_level.value
+        data = json.loads(call_args[1]["data"])
+        assert data["permission"] == access_level.value
 
 
 def test_modify_user_access_url_parsing(mock_progress):
@@ -249,7 +266,7 @@ def test_modify_user_access_headers_and_data(
     assert headers["Authorization"] == "token custom_token_456"
     assert headers["Accept"] == "application/vnd.github.v3+json"
     # verify data
-    data = call_args[1]["json"]
+    data = json.loads(call_args[1]["data"])
     assert data["permission"] == "write"
 
 
@@ -291,3 +308,360 @@ def test_modify_user_access_various_status_codes(
         # verify error message contains status code
         error_message = mock_progress.console.print.call_args[0][0]
         assert f"Diagnostic: {status_code}" in error_message
+
+
+def test_modify_user_access_skips_unchanged_access_level(
+    mock_progress, sample_request_data
+):
+    """Test that a user who already has the access level is not changed."""
+    # create mock PUT function that should not be called
+    mock_put = Mock()
+    # call the function with the current access level
+    result = modify_user_access(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        username=sample_request_data["username"],
+        access_level=GitHubAccessLevel.READ,
+        token=sample_request_data["token"],
+        progress=mock_progress,
+        put_request_function=mock_put,
+        current_access_level="read",
+    )
+    # verify the result is a success without a request
+    assert result == StatusCode.SUCCESS
+    mock_put.assert_not_called()
+    message = mock_progress.console.print.call_args[0][0]
+    assert "Kept testuser's access at 'read' in assignment-testuser" in message
+
+
+def test_modify_user_access_changes_different_access_level(
+    mock_progress, sample_request_data
+):
+    """Test that a user with a different access level is changed."""
+    # create mock response
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.SUCCESS.value
+    # create mock PUT function
+    mock_put = Mock(return_value=mock_response)
+    # call the function with a different current access level
+    result = modify_user_access(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        username=sample_request_data["username"],
+        access_level=GitHubAccessLevel.WRITE,
+        token=sample_request_data["token"],
+        progress=mock_progress,
+        put_request_function=mock_put,
+        current_access_level="read",
+    )
+    # verify the request was made
+    assert result == StatusCode.SUCCESS
+    mock_put.assert_called_once()
+
+
+def test_create_access_levels_query_has_alias_for_each_user():
+    """Test that the query asks about the repository of each user."""
+    query = create_access_levels_query(
+        "test-org", "assignment", ["alice", "bob"]
+    )
+    assert query.startswith("query {")
+    assert (
+        'u0: repository(owner: "test-org", name: "assignment-alice")' in query
+    )
+    assert 'u1: repository(owner: "test-org", name: "assignment-bob")' in query
+    assert 'collaborators(login: "alice", first: 1)' in query
+    assert "query:" not in query
+    assert "permission" in query
+
+
+def test_create_access_levels_query_bounds_each_connection():
+    """Test that each collaborators connection has a pagination argument."""
+    query = create_access_levels_query(
+        "test-org", "assignment", ["alice", "bob", "carol"]
+    )
+    # note that GitHub rejects a connection without first or last
+    usernames_count = 3
+    assert query.count("collaborators(") == usernames_count
+    assert query.count(", first: 1)") == usernames_count
+
+
+def test_create_access_levels_query_escapes_names():
+    """Test that the query escapes quotes inside of the names."""
+    query = create_access_levels_query("org", "prefix", ['bad"name'])
+    assert 'name: "prefix-bad\\"name"' in query
+
+
+def test_get_user_access_levels_success(sample_request_data):
+    """Test that the access levels are read from the GraphQL response."""
+    # create mock response with one known user and one missing repository
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.content = orjson.dumps(
+        {
+            "data": {
+                "u0": {
+                    "collaborators": {
+                        "edges": [
+                            {
+                                "permission": "WRITE",
+                                "node": {"login": "Alice"},
+                            }
+                        ]
+                    }
+                },
+                "u1": None,
+            }
+        }
+    )
+    # create mock POST function
+    mock_post = Mock(return_value=mock_response)
+    # call the function
+    access_levels = get_user_access_levels(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        usernames=["alice", "bob"],
+        token=sample_request_data["token"],
+        post_request_function=mock_post,
+    )
+    # verify only the known user has an access level
+    assert access_levels == {"alice": "write"}
+    mock_post.assert_called_once()
+    call_args = mock_post.call_args
+    assert call_args[0][0] == "https://api.github.com/graphql"
+    assert call_args[1]["headers"] == create_headers("test_token_123")
+    assert "assignment-alice" in call_args[1]["json"]["query"]
+
+
+def test_get_user_access_levels_matches_exact_login(sample_request_data):
+    """Test that a user is matched by login and not by a search."""
+    # create mock response for a user whose login is a prefix of another
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.content = orjson.dumps(
+        {
+            "data": {
+                "u0": {
+                    "collaborators": {
+                        "edges": [
+                            {
+                                "permission": "WRITE",
+                                "node": {"login": "alice"},
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+    )
+    mock_post = Mock(return_value=mock_response)
+    access_levels = get_user_access_levels(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        usernames=["alice"],
+        token=sample_request_data["token"],
+        post_request_function=mock_post,
+    )
+    # verify that the query asked for the exact login of the user
+    query = mock_post.call_args[1]["json"]["query"]
+    assert 'collaborators(login: "alice", first: 1)' in query
+    assert access_levels == {"alice": "write"}
+
+
+def test_get_user_access_levels_not_collaborator(sample_request_data):
+    """Test that a user who is not a collaborator has no access."""
+    # create mock response where the login is not a collaborator
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.content = orjson.dumps(
+        {"data": {"u0": {"collaborators": {"edges": []}}}}
+    )
+    mock_post = Mock(return_value=mock_response)
+    access_levels = get_user_access_levels(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        usernames=["alice"],
+        token=sample_request_data["token"],
+        post_request_function=mock_post,
+    )
+    assert access_levels == {"alice": "none"}
+
+
+def test_get_user_access_levels_failure(sample_request_data):
+    """Test that a failed query leaves all of the access levels unknown."""
+    # create mock response for failure
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.UNAUTHORIZED.value
+    mock_post = Mock(return_value=mock_response)
+    with patch("reporover.user.load_response_json") as mock_load:
+        access_levels = get_user_access_levels(
+            github_organization_url=sample_request_data[
+                "github_organization_url"
+            ],
+            repo_prefix=sample_request_data["repo_prefix"],
+            usernames=["alice", "bob"],
+            token=sample_request_data["token"],
+            post_request_function=mock_post,
+        )
+    assert access_levels == {}
+    mock_load.assert_not_called()
+
+
+def test_get_user_access_levels_batches_users(sample_request_data):
+    """Test that the users are split into batches of queries."""
+    # create mock response without any data
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.content = orjson.dumps({"data": {}})
+    mock_post = Mock(return_value=mock_response)
+    usernames = [f"student{number}" for number in range(250)]
+    get_user_access_levels(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        usernames=usernames,
+        token=sample_request_data["token"],
+        post_request_function=mock_post,
+    )
+    # verify that there are batches of at most one hundred users
+    batch_size = GitHubGraphQLDetails.BATCH_SIZE.value
+    assert mock_post.call_count == math.ceil(len(usernames) / batch_size)
+    last_query = mock_post.call_args[1]["json"]["query"]
+    assert "u49:" in last_query
+    assert "u50:" not in last_query
+
+
+def test_get_user_access_levels_no_usernames(sample_request_data):
+    """Test that no request is made when there are no usernames."""
+    mock_post = Mock()
+    access_levels = get_user_access_levels(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        usernames=[],
+        token=sample_request_data["token"],
+        post_request_function=mock_post,
+    )
+    assert access_levels == {}
+    mock_post.assert_not_called()
+
+
+def test_plan_access_changes_keeps_users_that_need_a_change():
+    """Test that the plan holds the users without the requested access level."""
+    changed_usernames = plan_access_changes(
+        ["alice", "bob", "carol", "dave"],
+        GitHubAccessLevel.READ,
+        {"alice": "read", "bob": "write", "carol": "none"},
+    )
+    assert changed_usernames == ["bob", "carol", "dave"]
+
+
+def test_get_user_access_level_success(sample_request_data):
+    """Test that the access level of one user is read from the role name."""
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.content = orjson.dumps(
+        {"permission": "write", "role_name": "maintain"}
+    )
+    mock_get = Mock(return_value=mock_response)
+    access_level = get_user_access_level(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        username=sample_request_data["username"],
+        token=sample_request_data["token"],
+        get_request_function=mock_get,
+    )
+    assert access_level == "maintain"
+    expected_url = "https://api.github.com/repos/test-org/assignment-testuser/collaborators/testuser/permission"
+    assert mock_get.call_args[0][0] == expected_url
+
+
+def test_get_user_access_level_failure(sample_request_data):
+    """Test that a failed request leaves the access level unknown."""
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.NOT_FOUND.value
+    mock_get = Mock(return_value=mock_response)
+    with patch("reporover.user.load_response_json") as mock_load:
+        access_level = get_user_access_level(
+            github_organization_url=sample_request_data[
+                "github_organization_url"
+            ],
+            repo_prefix=sample_request_data["repo_prefix"],
+            username=sample_request_data["username"],
+            token=sample_request_data["token"],
+            get_request_function=mock_get,
+        )
+    assert access_level is None
+    mock_load.assert_not_called()
+
+
+def test_permission_bodies_cover_all_access_levels():
+    """Test that there is a serialized body for each access level."""
+    assert set(permission_bodies) == set(GitHubAccessLevel)
+    for access_level, body in permission_bodies.items():
+        assert json.loads(body) == {"permission": access_level.value}
+
+
+def test_modify_user_access_connection_error(
+    mock_progress, sample_request_data
+):
+    """Test that a connection error is a failure for the user."""
+    mock_put = Mock(side_effect=requests.ConnectionError("connection reset"))
+    result = modify_user_access(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        username=sample_request_data["username"],
+        access_level=sample_request_data["access_level"],
+        token=sample_request_data["token"],
+        progress=mock_progress,
+        put_request_function=mock_put,
+    )
+    assert result == StatusCode.FAILURE
+    error_message = mock_progress.console.print.call_args[0][0]
+    assert "Failed to change testuser's access" in error_message
+    assert "connection reset" in error_message
+
+
+def test_get_user_access_levels_connection_error(sample_request_data):
+    """Test that a batch whose request cannot connect is skipped."""
+    mock_response = Mock()
+    mock_response.status_code = StatusCode.WORKING.value
+    mock_response.content = orjson.dumps(
+        {
+            "data": {
+                "u0": {
+                    "collaborators": {
+                        "edges": [
+                            {"permission": "READ", "node": {"login": "bob"}}
+                        ]
+                    }
+                }
+            }
+        }
+    )
+    # the first batch cannot connect and the second batch works
+    mock_post = Mock(
+        side_effect=[requests.ConnectionError("reset"), mock_response]
+    )
+    with patch("reporover.user.GitHubGraphQLDetails") as mock_details:
+        mock_details.BATCH_SIZE.value = 1
+        access_levels = get_user_access_levels(
+            github_organization_url=sample_request_data[
+                "github_organization_url"
+            ],
+            repo_prefix=sample_request_data["repo_prefix"],
+            usernames=["alice", "bob"],
+            token=sample_request_data["token"],
+            post_request_function=mock_post,
+        )
+    assert access_levels == {"bob": "read"}
+
+
+def test_get_user_access_level_timeout(sample_request_data):
+    """Test that a timeout leaves the access level unknown."""
+    mock_get = Mock(side_effect=requests.Timeout("read timed out"))
+    access_level = get_user_access_level(
+        github_organization_url=sample_request_data["github_organization_url"],
+        repo_prefix=sample_request_data["repo_prefix"],
+        username=sample_request_data["username"],
+        token=sample_request_data["token"],
+        get_request_function=mock_get,
+    )
+    assert access_level is None
@@ -9,7 +9,15 @@ from hypothesis import strategies as st
 from rich.console import Console
 from rich.progress import Progress
 
-from reporover.util import print_json_string, read_usernames_from_json
+from reporover.util import (
+    create_headers,
+    get_organization_name,
+    load_response_json,
+    parse_tokens,
+    print_json_string,
+    read_usernames_from_json,
+    select_usernames,
+)
 
 
 @pytest.fixture
@@ -44,6 +52,17 @@ def test_print_json_string_multiple_key_values(progress, capsys):
     assert "key1: value1" in captured.out
 
 
+def test_print_json_string_prints_once():
+    """Confirm that print_json_string displays all pairs with one call."""
+    mock_console = Mock()
+    progress = Mock()
+    progress.console = mock_console
+    print_json_string('{"key1": "value1", "key2": "value2"}', progress)
+    mock_console.print.assert_called_once_with(
+        "  key1: value1\n  key2: value2"
+    )
+
+
 def test_print_json_string_special_characters(progress, capsys):
     """Confirm that print_json_string works correctly with special characters in JSON string."""
     json_string = '{"key!@#": "value$%^"}'
@@ -119,29 +138,136 @@ def test_print_json_string_property(test_dict):
     if not test_dict:
         mock_console.print.assert_not_called()
     else:
-        assert mock_console.print.call_count == len(test_dict)
-        for key, value in test_dict.items():
-            mock_console.print.assert_any_call(f"  {key}: {value}")
+        mock_console.print.assert_called_once_with(
+            "\n".join(f"  {key}: {value}" for key, value in test_dict.items())
+        )
 
 
 @pytest.mark.property
 @given(st.lists(st.text()))
 def test_read_usernames_from_json_property(username_list):
     """Property-based test for read_usernames_from_json with arbitrary username lists."""
-    # create mock file path and mock file operations;
-    # note that this also mocks the context manager behavior of
-    # file opening since that is used in the function under test
+    # create mock file path that is small enough to
+    # be read in one call instead of mapped into memory
     mock_path = Mock()
-    mock_file = Mock()
-    mock_context_manager = Mock()
-    mock_context_manager.__enter__ = Mock(return_value=mock_file)
-    mock_context_manager.__exit__ = Mock(return_value=None)
-    mock_path.open.return_value = mock_context_manager
-    # mock json.load to return our test data
-    with patch("reporover.util.json.load") as mock_json_load:
-        mock_json_load.return_value = {"usernames": username_list}
+    mock_path.stat.return_value.st_size = 0
+    mock_path.read_bytes.return_value = b""
+    # mock orjson.loads to return our test data
+    with patch("reporover.util.orjson.loads") as mock_loads:
+        mock_loads.return_value = {"usernames": username_list}
         # test the function
         result = read_usernames_from_json(mock_path)
         # confirm that the user names are correctly
         # inside of the list after calling the function
         assert result == username_list
+
+
+def test_read_usernames_from_json_large_file(tmp_json_file):
+    """Test reading usernames from a file that is mapped into memory."""
+    file_path = tmp_json_file({"usernames": ["user1", "user2"]})
+    with patch("reporover.util.DataFileDetails") as mock_details:
+        mock_details.MEMORY_MAP_BYTES.value = 0
+        usernames = read_usernames_from_json(file_path)
+    assert usernames == ["user1", "user2"]
+
+
+def test_parse_tokens_single_token():
+    """Confirm that parse_tokens returns a single token unchanged."""
+    assert parse_tokens("token_one") == ["token_one"]
+
+
+def test_parse_tokens_multiple_tokens():
+    """Confirm that parse_tokens splits and strips comma-separated tokens."""
+    assert parse_tokens("token_one, token_two,") == ["token_one", "token_two"]
+
+
+@pytest.mark.parametrize(
+    "github_organization_url",
+    [
+        "https://github.com/my-org",
+        "https://github.com/my-org/",
+        "https://github.com/my-org/repo",
+        "github.com/my-org",
+        "https://www.github.com/my-org",
+        "www.github.com/my-org/",
+    ],
+)
+def test_get_organization_name(github_organization_url):
+    """Confirm that get_organization_name extracts the organization name."""
+    assert get_organization_name(github_organization_url) == "my-org"
+
+
+@pytest.mark.parametrize(
+    "github_organization_url",
+    ["https://gitlab.com/my-org", "https://github.com/", "my-org", ""],
+)
+def test_get_organization_name_rejects_malformed_url(github_organization_url):
+    """Confirm that get_organization_name rejects a URL without an organization."""
+    with pytest.raises(
+        ValueError, match="not the URL of a GitHub organization"
+    ):
+        get_organization_name(github_organization_url)
+
+
+def test_create_headers():
+    """Confirm that create_headers authenticates with the token."""
+    assert create_headers("token_one") == {
+        "Authorization": "token token_one",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    # verify that the headers for a token are shared and read-only
+    headers = create_headers("token_one")
+    assert create_headers("token_one") is headers
+    with pytest.raises(TypeError):
+        headers["Accept"] = "text/plain"  # type: ignore[index]
+
+
+def test_create_headers_with_content_type():
+    """Confirm that create_headers can describe the body of the request."""
+    assert create_headers("token_one", "application/json") == {
+        "Authorization": "token token_one",
+        "Accept": "application/vnd.github.v3+json",
+        "Content-Type": "application/json",
+    }
+    assert "Content-Type" not in create_headers("token_one")
+
+
+def test_load_response_json_decodes_content():
+    """Test that the JSON body is decoded from the raw bytes of a response."""
+    response = Mock()
+    response.content = b'{"data": {"u0": null}, "names": ["caf\xc3\xa9"]}'
+    assert load_response_json(response) == {
+        "data": {"u0": None},
+        "names": ["caf\u00e9"],
+    }
+    response.json.assert_not_called()
+
+
+def test_select_usernames_keeps_file_order():
+    """Confirm that the selected usernames keep the order of the file."""
+    usernames = ["student3", "student1", "student2"]
+    selected = select_usernames(usernames, ["student2", "student3", "other"])
+    assert selected == ["student3", "student2"]
+
+
+def test_select_usernames_without_selection_removes_duplicates():
+    """Confirm that all usernames are kept once when none are selected."""
+    usernames = ["student1", "student2", "student1"]
+    assert select_usernames(usernames, None) == ["student1", "student2"]
+    assert select_usernames(usernames, []) == ["student1", "student2"]
+
+
+@pytest.mark.property
+@given(st.lists(st.text()), st.lists(st.text()))
+def test_select_usernames_property(usernames, selected_usernames):
+    """Property-based test for select_usernames with arbitrary usernames."""
+    selected = select_usernames(usernames, selected_usernames)
+    # every username appears once and in the order of the file
+    assert len(selected) == len(set(selected))
+    positions = [usernames.index(name) for name in selected]
+    assert positions == sorted(positions)
+    # the result is the same set as the previous set intersection
+    if selected_usernames:
+        assert set(selected) == set(usernames) & set(selected_usernames)
+    else:
+        assert set(selected) == set(usernames)